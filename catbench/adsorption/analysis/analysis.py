@@ -5,8 +5,10 @@ Provides comprehensive statistical analysis, anomaly detection, and professional
 for adsorption energy benchmarking results with Machine Learning Interatomic Potentials (MLIPs).
 """
 
-import json
+import multiprocessing
 import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 import matplotlib
 matplotlib.use('Agg')
@@ -16,12 +18,24 @@ import numpy as np
 import pandas as pd
 from ase.io import read
 
-from catbench.config import ANALYSIS_DEFAULTS, get_default, PLOT_COLORS, PLOT_MARKERS
+from catbench.config import ANALYSIS_DEFAULTS, get_default, PLOT_COLOR_CYCLE, PLOT_MARKER_CYCLE, PNG_PIL_KWARGS
 from catbench.utils.analysis_utils import (
     find_adsorbate, min_max, set_matplotlib_font, get_ads_eng_range, prepare_plot_data,
     get_calculator_keys, get_median_calculator_key, classify_reaction, safe_mae, write_cell
 )
-from catbench.utils.io_utils import save_anomaly_detection_results
+from catbench.utils.io_utils import read_json, save_anomaly_detection_results
+
+
+# Analysis instance shared with forked worker processes when n_workers > 1. Set
+# in the parent right before the pool forks so workers inherit it copy-on-write.
+_ANALYSIS_WORKER_STATE = {}
+
+
+def _worker_analyze_mlip(mlip_name):
+    """Analyse one MLIP inside a worker process (see AdsorptionAnalysis._run_analysis)."""
+    return _ANALYSIS_WORKER_STATE["analysis"]._analyze_mlip(mlip_name)
+
+
 class AdsorptionAnalysis:
     """
     Adsorption energy analysis class for MLIP benchmarking.
@@ -65,6 +79,8 @@ class AdsorptionAnalysis:
                                          Default: Working directory name
         time_unit (str, optional): Time unit for display ("s", "ms", "µs").
                                  Default: "ms"
+        n_workers (int, optional): Number of MLIPs analysed in parallel by a
+                                 fork-based process pool (POSIX only). Default: 1 (serial)
         disp_thrs (float, optional): Substrate displacement threshold in Å. Default: 1.0
         reproduction_thrs (float, optional): Reproducibility threshold in eV. Default: 0.2
         energy_thrs (float, optional): Energy anomaly threshold in eV. Default: 2.0
@@ -106,11 +122,14 @@ class AdsorptionAnalysis:
         self.exclude_adsorbates = kwargs.get("exclude_adsorbates", get_default("exclude_adsorbates", ANALYSIS_DEFAULTS))
         self.benchmarking_name = kwargs.get("benchmarking_name", get_default("benchmarking_name", ANALYSIS_DEFAULTS))
         self.time_unit = kwargs.get("time_unit", get_default("time_unit", ANALYSIS_DEFAULTS))
+        self.n_workers = kwargs.get("n_workers", get_default("n_workers", ANALYSIS_DEFAULTS))
         
         # Cache for performance optimization
         self._adwt_cache = {}
         self._amdwt_cache = {}
-        self._mlip_result_cache = {}
+        # Parsed {MLIP}_result.json per MLIP, keyed by file mtime, so repeated
+        # analysis() / threshold_sensitivity_analysis() calls do not re-parse
+        self._result_file_cache = {}
         self._calculation_cache = {}
 
         # Anomaly detection thresholds
@@ -159,8 +178,34 @@ class AdsorptionAnalysis:
         self.plot_enabled = kwargs.get("plot_enabled", get_default("plot_enabled", ANALYSIS_DEFAULTS))
 
         # Color and marker settings for multi plots
-        self.colors = PLOT_COLORS
-        self.markers = PLOT_MARKERS
+        self.colors = PLOT_COLOR_CYCLE
+        self.markers = PLOT_MARKER_CYCLE
+
+        # (fig, ax) reused across one MLIP's parity plots (see _plot_generator)
+        self._shared_plot = None
+        # Entries of the legend.png last written per multi-plot directory during
+        # one _plot_generator pass
+        self._legend_written = {}
+        # font_setting already registered with matplotlib (done once, not per MLIP)
+        self._applied_font = None
+
+    def _load_mlip_result(self, mlip_name):
+        """Load {mlip_name}_result.json, reusing the parsed copy while the file is unchanged."""
+        result_file = f"{self.calculating_path}/{mlip_name}/{mlip_name}_result.json"
+        mtime = os.path.getmtime(result_file)
+        cached = self._result_file_cache.get(mlip_name)
+        if cached is None or cached[0] != mtime:
+            cached = self._result_file_cache[mlip_name] = (mtime, read_json(result_file))
+        return cached[1]
+
+    def _find_mlip_results(self):
+        """MLIP names under calculating_path that have a {name}_result.json."""
+        with os.scandir(self.calculating_path) as entries:
+            return sorted([
+                entry.name for entry in entries
+                if entry.is_dir()
+                and os.path.exists(os.path.join(entry.path, f"{entry.name}_result.json"))
+            ], key=str.lower)
 
     def _display_mlip_name(self, mlip_name):
         """Return mapped display name for MLIP if provided, else original name."""
@@ -192,14 +237,19 @@ class AdsorptionAnalysis:
         os.makedirs(mono_path, exist_ok=True)
         os.makedirs(multi_path, exist_ok=True)
 
-        if self.font_setting:
+        if self.font_setting and self._applied_font != tuple(self.font_setting):
             set_matplotlib_font(self.font_setting[0], self.font_setting[1])
+            self._applied_font = tuple(self.font_setting)
 
         return plot_save_path, mono_path, multi_path
 
     def _create_base_plot(self, min_value, max_value):
-        """Create base plot configuration."""
-        fig, ax = plt.subplots(figsize=self.figsize)
+        """Create base plot configuration (on the shared Figure when one is active)."""
+        if self._shared_plot is not None:
+            fig, ax = self._shared_plot
+            ax.clear()
+        else:
+            fig, ax = plt.subplots(figsize=self.figsize)
         ax.set_xlim(min_value, max_value)
         ax.set_ylim(min_value, max_value)
         ax.plot([min_value, max_value], [min_value, max_value], "r-", zorder=100000)
@@ -327,11 +377,11 @@ class AdsorptionAnalysis:
                 ax.set_ylabel(f"{display_name} (eV)", fontsize=self.ylabel_fontsize)
             ax.tick_params(axis="both", which="major", labelsize=self.tick_labelsize)
 
-            fig.savefig(f"{mono_path}/{tag}.png", dpi=self.dpi, bbox_inches='tight')
+            fig.savefig(f"{mono_path}/{tag}.png", dpi=self.dpi, bbox_inches='tight', pil_kwargs=PNG_PIL_KWARGS)
 
             return MAE
         finally:
-            plt.close(fig)
+            self._release_plot(fig)
 
     def multi_plotter(self, ads_data, mlip_name, types, tag, min_value, max_value, multi_path):
         """Create multi-color plot with adsorbate-specific colors."""
@@ -344,6 +394,11 @@ class AdsorptionAnalysis:
                 ads_data, mlip_name, types, tag, multi_path, fig, ax
             )
         finally:
+            self._release_plot(fig)
+
+    def _release_plot(self, fig):
+        """Close a per-plot Figure; the shared one is closed by _plot_generator."""
+        if self._shared_plot is None or fig is not self._shared_plot[0]:
             plt.close(fig)
 
     def _multi_plotter_body(self, ads_data, mlip_name, types, tag, multi_path, fig, ax):
@@ -353,7 +408,7 @@ class AdsorptionAnalysis:
         analysis_adsorbates = sorted([ads for ads in ads_data.keys() if ads != "all"],
                                    key=lambda ads: (-self._get_adsorbate_count(ads, ads_data), ads))
         len_adsorbates = len(analysis_adsorbates)
-        legend_width = len(max(analysis_adsorbates, key=len)) if analysis_adsorbates else 0
+        legend_width = max(map(len, analysis_adsorbates), default=0)
 
         error_sum = 0
         len_total = 0
@@ -388,9 +443,9 @@ class AdsorptionAnalysis:
             scatter = ax.scatter(
                 dft_data,
                 mlip_data,
-                color=self.colors[i],
+                color=self.colors[i % len(self.colors)],
                 label=f"* {adsorbate}",
-                marker=self.markers[i],
+                marker=self.markers[i % len(self.markers)],
                 s=self.mark_size,
                 edgecolors="black",
                 linewidths=self.linewidths,
@@ -460,7 +515,15 @@ class AdsorptionAnalysis:
             )
             legend.set_zorder(1001)  # Display legend on top (slightly above MAE text)
         else:
-            if scatter_handles:
+            # Each tag writes the same legend.png; re-render it only when its
+            # entries (labels, and their order, which fixes color and marker)
+            # differ from the ones already on disk.
+            legend_key = (
+                tuple(analysis_adsorbates),
+                tuple(handle.get_label() for handle in scatter_handles),
+            )
+            if scatter_handles and self._legend_written.get(multi_path) != legend_key:
+                self._legend_written[multi_path] = legend_key
                 fig_legend = plt.figure()
                 try:
                     fig_legend.legend(
@@ -471,7 +534,7 @@ class AdsorptionAnalysis:
                         fontsize=self.legend_fontsize,
                         markerscale=self.legend_markerscale,
                     )
-                    fig_legend.savefig(f"{multi_path}/legend.png", dpi=self.dpi, bbox_inches="tight")
+                    fig_legend.savefig(f"{multi_path}/legend.png", dpi=self.dpi, bbox_inches="tight", pil_kwargs=PNG_PIL_KWARGS)
                 finally:
                     plt.close(fig_legend)
 
@@ -479,7 +542,7 @@ class AdsorptionAnalysis:
         if len_total == 0:
             return MAEs
 
-        fig.savefig(f"{multi_path}/{tag}.png", dpi=self.dpi, bbox_inches='tight')
+        fig.savefig(f"{multi_path}/{tag}.png", dpi=self.dpi, bbox_inches='tight', pil_kwargs=PNG_PIL_KWARGS)
 
         return MAEs
 
@@ -488,20 +551,20 @@ class AdsorptionAnalysis:
         output_file = f"{self.benchmarking_name}_Benchmarking_Analysis.xlsx"
 
         with pd.ExcelWriter(output_file, engine="xlsxwriter") as writer:
+            # Cell formats are shared by every sheet of the workbook
+            formats = self._create_excel_formats(writer.book)
+
             # Create custom MLIP_Data sheet with merged cells
-            self._create_mlip_data_sheet(writer, main_data)
+            self._create_mlip_data_sheet(writer, main_data, formats)
 
             if anomaly_data:
                 # Create custom anomaly sheet with merged cells like main sheet
-                self._create_anomaly_sheet(writer, anomaly_data)
+                self._create_anomaly_sheet(writer, anomaly_data, formats)
 
             for mlip_name in sorted(MLIPs_data.keys(), key=str.lower):
                 data_dict = MLIPs_data[mlip_name]
                 data_tmp = []
 
-                # Use cached mlip_result instead of reloading from file
-                mlip_result = self._mlip_result_cache.get(mlip_name, {})
-
                 display_name = self._display_mlip_name(mlip_name)
                 for adsorbate in analysis_adsorbates:
                     if "normal" in data_dict and f"len_{adsorbate}" in data_dict["normal"]:
@@ -546,37 +609,48 @@ class AdsorptionAnalysis:
                     # All sheets (MLIP_Data, anomaly, per-MLIP) are written with their
                     # own formatting by the dedicated _create_*_sheet helpers, so no
                     # post-loop generic formatting pass is required.
-                    self._create_mlip_sheet(writer, data_tmp, mlip_name)
+                    self._create_mlip_sheet(writer, data_tmp, mlip_name, formats)
 
         print(f"Excel file '{output_file}' created successfully.")
 
-    def _create_mlip_data_sheet(self, writer, main_data):
+    def _create_excel_formats(self, workbook):
+        """Create the cell formats used by the Excel sheets, once per workbook."""
+        return {
+            "header_format": workbook.add_format({
+                "align": "center", 
+                "valign": "vcenter",
+                "text_wrap": True,
+                "bold": True
+            }),
+            "center_align": workbook.add_format({"align": "center", "valign": "vcenter"}),
+            "bold_center_align": workbook.add_format({
+                "align": "center", 
+                "valign": "vcenter", 
+                "bold": True
+            }),
+            "number_format_2f": workbook.add_format(
+                {"num_format": "0.00", "align": "center", "valign": "vcenter"}
+            ),
+            "number_format_3f": workbook.add_format(
+                {"num_format": "0.000", "align": "center", "valign": "vcenter"}
+            ),
+            "number_format_0f": workbook.add_format(
+                {"num_format": "#,##0", "align": "center", "valign": "vcenter"}
+            ),
+        }
+
+    def _create_mlip_data_sheet(self, writer, main_data, formats):
         """Create MLIP_Data sheet with custom merged cell structure."""
         workbook = writer.book
         worksheet = workbook.add_worksheet("MLIP_Data")
 
-        # Define formats
-        header_format = workbook.add_format({
-            "align": "center", 
-            "valign": "vcenter",
-            "text_wrap": True,
-            "bold": True
-        })
-        center_align = workbook.add_format({"align": "center", "valign": "vcenter"})
-        bold_center_align = workbook.add_format({
-            "align": "center", 
-            "valign": "vcenter", 
-            "bold": True
-        })
-        number_format_2f = workbook.add_format(
-            {"num_format": "0.00", "align": "center", "valign": "vcenter"}
-        )
-        number_format_3f = workbook.add_format(
-            {"num_format": "0.000", "align": "center", "valign": "vcenter"}
-        )
-        number_format_0f = workbook.add_format(
-            {"num_format": "#,##0", "align": "center", "valign": "vcenter"}
-        )
+        # Formats shared across sheets (see _create_excel_formats)
+        header_format = formats["header_format"]
+        center_align = formats["center_align"]
+        bold_center_align = formats["bold_center_align"]
+        number_format_2f = formats["number_format_2f"]
+        number_format_3f = formats["number_format_3f"]
+        number_format_0f = formats["number_format_0f"]
 
         # Column structure:
         # 0: MLIP_name, 1: Normal rate, 2: Adsorbate migration rate, 3-6: Anomaly rate (4 columns), 7: MAE_total, 8: MAE_normal, 9: MAE_single
@@ -656,31 +730,19 @@ class AdsorptionAnalysis:
         for col, width in enumerate(column_widths):
             worksheet.set_column(col, col, width)
 
-        # Set row heights
-        for row in range(len(main_data) + 2):
-            worksheet.set_row(row, 25)
+        # Set row heights (sheet-wide default: one call instead of one per row)
+        worksheet.set_default_row(25)
 
-    def _create_anomaly_sheet(self, writer, anomaly_data):
+    def _create_anomaly_sheet(self, writer, anomaly_data, formats):
         """Create anomaly sheet with custom merged cell structure like main sheet."""
         workbook = writer.book
         worksheet = workbook.add_worksheet("anomaly")
 
-        # Define formats
-        header_format = workbook.add_format({
-            "align": "center", 
-            "valign": "vcenter",
-            "text_wrap": True,
-            "bold": True
-        })
-        center_align = workbook.add_format({"align": "center", "valign": "vcenter"})
-        bold_center_align = workbook.add_format({
-            "align": "center", 
-            "valign": "vcenter", 
-            "bold": True
-        })
-        number_format_0f = workbook.add_format(
-            {"num_format": "#,##0", "align": "center", "valign": "vcenter"}
-        )
+        # Formats shared across sheets (see _create_excel_formats)
+        header_format = formats["header_format"]
+        center_align = formats["center_align"]
+        bold_center_align = formats["bold_center_align"]
+        number_format_0f = formats["number_format_0f"]
 
         # Column structure:
         # 0: MLIP_name, 1: Num_normal, 2: Num_adsorbate_migration, 3-6: Anomaly count (4 columns), 7-9: Reproduction failure (3 columns), 10-13: Unphysical relaxation (4 columns)
@@ -754,35 +816,21 @@ class AdsorptionAnalysis:
         for col, width in enumerate(column_widths):
             worksheet.set_column(col, col, width)
 
-        # Set row heights
-        for row in range(len(anomaly_data) + 2):
-            worksheet.set_row(row, 25)
+        # Set row heights (sheet-wide default: one call instead of one per row)
+        worksheet.set_default_row(25)
 
-    def _create_mlip_sheet(self, writer, data_tmp, mlip_name):
+    def _create_mlip_sheet(self, writer, data_tmp, mlip_name, formats):
         """Create individual MLIP sheet with custom merged cell structure like main sheet."""
         workbook = writer.book
         display_name = self._display_mlip_name(mlip_name)
         worksheet = workbook.add_worksheet(display_name)
 
-        # Define formats
-        header_format = workbook.add_format({
-            "align": "center", 
-            "valign": "vcenter",
-            "text_wrap": True,
-            "bold": True
-        })
-        center_align = workbook.add_format({"align": "center", "valign": "vcenter"})
-        bold_center_align = workbook.add_format({
-            "align": "center", 
-            "valign": "vcenter", 
-            "bold": True
-        })
-        number_format_0f = workbook.add_format(
-            {"num_format": "#,##0", "align": "center", "valign": "vcenter"}
-        )
-        number_format_3f = workbook.add_format(
-            {"num_format": "0.000", "align": "center", "valign": "vcenter"}
-        )
+        # Formats shared across sheets (see _create_excel_formats)
+        header_format = formats["header_format"]
+        center_align = formats["center_align"]
+        bold_center_align = formats["bold_center_align"]
+        number_format_0f = formats["number_format_0f"]
+        number_format_3f = formats["number_format_3f"]
 
         # Column structure:
         # 0: Adsorbate_name, 1: MAE_total, 2: MAE_normal, 3: MAE_single, 4: ADwT, 5: AMDwT, 
@@ -850,9 +898,8 @@ class AdsorptionAnalysis:
         for col, width in enumerate(column_widths):
             worksheet.set_column(col, col, width)
 
-        # Set row heights
-        for row in range(len(data_tmp) + 2):
-            worksheet.set_row(row, 25)
+        # Set row heights (sheet-wide default: one call instead of one per row)
+        worksheet.set_default_row(25)
 
     def analysis(self):
         """
@@ -909,11 +956,7 @@ class AdsorptionAnalysis:
 
         # Get MLIP list
         if self.mlip_list is None:
-            self.mlip_list = sorted([
-                name for name in os.listdir(self.calculating_path)
-                if os.path.isdir(os.path.join(self.calculating_path, name))
-                and os.path.exists(os.path.join(self.calculating_path, name, f"{name}_result.json"))
-            ], key=str.lower)
+            self.mlip_list = self._find_mlip_results()
 
         # Backup original threshold values
         original_disp_thrs = self.disp_thrs
@@ -927,8 +970,7 @@ class AdsorptionAnalysis:
                     print(f"  Warning: Result file not found for {mlip_name}")
                     continue
 
-                with open(result_file, "r") as f:
-                    mlip_result = json.load(f)
+                mlip_result = self._load_mlip_result(mlip_name)
 
                 # Get n_crit_relax
                 n_crit_relax = mlip_result.get("calculation_settings", {}).get("n_crit_relax", 999)
@@ -1178,7 +1220,8 @@ class AdsorptionAnalysis:
                 dpi=self.dpi,
                 bbox_inches='tight',
                 facecolor='white',
-                edgecolor='none'
+                edgecolor='none',
+                pil_kwargs=PNG_PIL_KWARGS,
             )
         finally:
             plt.close(fig)
@@ -1285,314 +1328,363 @@ class AdsorptionAnalysis:
 
         # Get MLIP list
         if self.mlip_list is None:
-            self.mlip_list = sorted([
-                name for name in os.listdir(self.calculating_path)
-                if os.path.isdir(os.path.join(self.calculating_path, name))
-                and os.path.exists(os.path.join(self.calculating_path, name, f"{name}_result.json"))
-            ], key=str.lower)
-
-        for mlip_name in sorted(self.mlip_list, key=str.lower):
-            adsorbates = set()
-            print(f"Processing {self._display_mlip_name(mlip_name)}")
-
-            # Load results first
-            with open(f"{self.calculating_path}/{mlip_name}/{mlip_name}_result.json", "r") as f:
-                mlip_result = json.load(f)
-
-            # Get n_crit_relax from calculation settings (with fallback to default)
-            n_crit_relax = mlip_result.get("calculation_settings", {}).get("n_crit_relax", 999)
-
-            # Perform anomaly detection with configured thresholds
-            MLIP_anomaly, anomaly_summary = self._anomaly_detection(mlip_result, mlip_name, n_crit_relax)
-
-            # Save anomaly detection results
-            os.makedirs(f"{self.calculating_path}/{mlip_name}", exist_ok=True)
-            anomaly_detection_save = {
-                "thresholds": MLIP_anomaly["thresholds"],
-                "normal": MLIP_anomaly["normal"],
-                "energy_anomaly": MLIP_anomaly["energy_anomaly"],
-                "adsorbate_migration": MLIP_anomaly["adsorbate_migration"],
-                "unphysical_relaxation": MLIP_anomaly["unphysical_relaxation"],
-                "reproduction_failure": MLIP_anomaly["reproduction_failure"]
-            }
-            save_anomaly_detection_results(
-                self.calculating_path, mlip_name, anomaly_detection_save
+            self.mlip_list = self._find_mlip_results()
+
+        mlip_names = sorted(self.mlip_list, key=str.lower)
+        n_workers = min(int(self.n_workers or 1), len(mlip_names))
+        if n_workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            warnings.warn(
+                "n_workers > 1 requires the 'fork' start method, which is not "
+                "available on this platform; analysing MLIPs serially.",
+                stacklevel=3,
             )
+            n_workers = 1
 
-            # Initialize data structures for 5-category classification
-            ads_data = {
-                "all": {
-                    "normal": {"DFT": [], "MLIP": [], 
-                             "MLIP_min": [], "MLIP_max": []},
-                    "energy_anomaly": {"DFT": [], "MLIP": [], 
-                                     "MLIP_min": [], "MLIP_max": []},
-                    "adsorbate_migration": {"DFT": [], "MLIP": [], 
-                                          "MLIP_min": [], "MLIP_max": []},
-                    "unphysical_relaxation": {"DFT": [], "MLIP": [], 
-                                            "MLIP_min": [], "MLIP_max": []},
-                    "reproduction_failure": {"DFT": [], "MLIP": [], 
-                                           "MLIP_min": [], "MLIP_max": []},
-                }
-            }
-
-            # Check if absolute energy MLIP (has slab calculations)
-            first_reaction = True
-            absolute_energy_MLIP = True
-            for reaction in mlip_result:
-                if reaction == "calculation_settings":
-                    continue
+        if n_workers > 1:
+            # MLIPs are independent: each worker inherits this instance
+            # copy-on-write and returns only the rows and cache entries it made
+            global _ANALYSIS_WORKER_STATE
+            _ANALYSIS_WORKER_STATE = {"analysis": self}
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=n_workers, mp_context=multiprocessing.get_context("fork")
+                ) as pool:
+                    outcomes = list(pool.map(_worker_analyze_mlip, mlip_names))
+            finally:
+                _ANALYSIS_WORKER_STATE = {}
+        else:
+            outcomes = [self._analyze_mlip(mlip_name) for mlip_name in mlip_names]
+
+        for mlip_name, outcome in zip(mlip_names, outcomes):
+            analysis_adsorbates = outcome["analysis_adsorbates"]
+            self._adwt_cache.update(outcome["adwt_cache"])
+            self._amdwt_cache.update(outcome["amdwt_cache"])
+            self._result_file_cache[mlip_name] = outcome["result_file"]
+            if outcome["main"] is not None:
+                main_data.append(outcome["main"])
+                MLIP_datas[mlip_name] = outcome["mlip_data"]
+                anomaly_data.append(outcome["anomaly"])
 
-                adsorbate = find_adsorbate(mlip_result[reaction]["reference"])
-                if adsorbate:
-                    adsorbates.add(adsorbate)
+        # Create Excel output
+        self._create_excel_output(main_data, anomaly_data, MLIP_datas, list(analysis_adsorbates))
 
-                if first_reaction:
-                    first_reaction = False
-                    if "slab_conv" not in anomaly_summary[reaction]["details"]:
-                        absolute_energy_MLIP = False
-            # Determine analysis adsorbates
-            analysis_adsorbates = self._get_analysis_adsorbates(adsorbates)
 
-            # Initialize counters
-            time_accum = 0
-            step_accum = 0
-            slab_conv = ads_conv = slab_move = ads_move = 0
-            slab_seed = ads_seed = ads_eng_seed = 0
+    def _analyze_mlip(self, mlip_name):
+        """
+        Run anomaly detection, plotting and metric calculation for one MLIP.
 
-            # Process each reaction
-            for reaction in mlip_result:
-                if reaction == "calculation_settings":
-                    continue
+        Returns a dict with the MLIP's MLIP_Data / anomaly rows and per-MLIP sheet
+        data (None if it has no data to plot), its analysis adsorbates, the
+        ADwT / AMDwT cache entries it computed, and its parsed result file.
+        """
+        adsorbates = set()
+        outcome = {"analysis_adsorbates": None, "main": None, "anomaly": None,
+                   "mlip_data": None, "adwt_cache": {}, "amdwt_cache": {},
+                   "result_file": None}
+        print(f"Processing {self._display_mlip_name(mlip_name)}")
+
+        # Load results first
+        mlip_result = self._load_mlip_result(mlip_name)
+        # (mtime, parsed result): a forked worker's cache is otherwise lost, and
+        # the parent would re-parse the file in the threshold-sensitivity pass
+        outcome["result_file"] = self._result_file_cache[mlip_name]
+
+        # Get n_crit_relax from calculation settings (with fallback to default)
+        n_crit_relax = mlip_result.get("calculation_settings", {}).get("n_crit_relax", 999)
+
+        # Perform anomaly detection with configured thresholds
+        MLIP_anomaly, anomaly_summary = self._anomaly_detection(mlip_result, mlip_name, n_crit_relax)
+
+        # Save anomaly detection results
+        os.makedirs(f"{self.calculating_path}/{mlip_name}", exist_ok=True)
+        anomaly_detection_save = {
+            "thresholds": MLIP_anomaly["thresholds"],
+            "normal": MLIP_anomaly["normal"],
+            "energy_anomaly": MLIP_anomaly["energy_anomaly"],
+            "adsorbate_migration": MLIP_anomaly["adsorbate_migration"],
+            "unphysical_relaxation": MLIP_anomaly["unphysical_relaxation"],
+            "reproduction_failure": MLIP_anomaly["reproduction_failure"]
+        }
+        save_anomaly_detection_results(
+            self.calculating_path, mlip_name, anomaly_detection_save
+        )
 
-                adsorbate = find_adsorbate(mlip_result[reaction]["reference"])
+        # Initialize data structures for 5-category classification
+        ads_data = {
+            "all": {
+                "normal": {"DFT": [], "MLIP": [], 
+                         "MLIP_min": [], "MLIP_max": []},
+                "energy_anomaly": {"DFT": [], "MLIP": [], 
+                                 "MLIP_min": [], "MLIP_max": []},
+                "adsorbate_migration": {"DFT": [], "MLIP": [], 
+                                      "MLIP_min": [], "MLIP_max": []},
+                "unphysical_relaxation": {"DFT": [], "MLIP": [], 
+                                        "MLIP_min": [], "MLIP_max": []},
+                "reproduction_failure": {"DFT": [], "MLIP": [], 
+                                       "MLIP_min": [], "MLIP_max": []},
+            }
+        }
 
-                # Apply energy cutoff filter (only if cutoff is specified)
-                if self.energy_cutoff is not None:
-                    try:
-                        reference_energy = mlip_result[reaction]["reference"]["ads_eng"]
-                        if reference_energy > self.energy_cutoff:
-                            continue  # Skip reactions with energy above cutoff
-                    except (KeyError, TypeError):
-                        continue  # Skip if reference energy is not available
+        # Check if absolute energy MLIP (has slab calculations). The
+        # adsorbate of each reaction is kept for the processing loop below.
+        first_reaction = True
+        absolute_energy_MLIP = True
+        reaction_adsorbates = {}
+        for reaction in mlip_result:
+            if reaction == "calculation_settings":
+                continue
 
-                if adsorbate and adsorbate in analysis_adsorbates:
-                    if adsorbate not in ads_data:
-                        ads_data[adsorbate] = {
-                            "normal": {"DFT": [], "MLIP": [], 
-                                     "MLIP_min": [], "MLIP_max": []},
-                            "energy_anomaly": {"DFT": [], "MLIP": [], 
-                                             "MLIP_min": [], "MLIP_max": []},
-                            "adsorbate_migration": {"DFT": [], "MLIP": [], 
-                                                  "MLIP_min": [], "MLIP_max": []},
-                            "unphysical_relaxation": {"DFT": [], "MLIP": [], 
-                                                    "MLIP_min": [], "MLIP_max": []},
-                            "reproduction_failure": {"DFT": [], "MLIP": [], 
-                                                   "MLIP_min": [], "MLIP_max": []},
-                        }
-
-                    classification = anomaly_summary[reaction]["classification"]
-                    MLIP_min, MLIP_max = get_ads_eng_range(mlip_result[reaction])
+            adsorbate = find_adsorbate(mlip_result[reaction]["reference"])
+            reaction_adsorbates[reaction] = adsorbate
+            if adsorbate:
+                adsorbates.add(adsorbate)
+
+            if first_reaction:
+                first_reaction = False
+                if "slab_conv" not in anomaly_summary[reaction]["details"]:
+                    absolute_energy_MLIP = False
+        # Determine analysis adsorbates
+        analysis_adsorbates = self._get_analysis_adsorbates(adsorbates)
+        outcome["analysis_adsorbates"] = analysis_adsorbates
+
+        # Initialize counters
+        time_accum = 0
+        step_accum = 0
+        slab_conv = ads_conv = slab_move = ads_move = 0
+        slab_seed = ads_seed = ads_eng_seed = 0
 
-                    try:
-                        # Add data to appropriate classification category
-                        dft_value = mlip_result[reaction]["reference"]["ads_eng"]
-                        mlip_value = mlip_result[reaction]["final"]["ads_eng_median"]
-
-                        # Add to adsorbate-specific data
-                        ads_data[adsorbate][classification]["DFT"].append(dft_value)
-                        ads_data[adsorbate][classification]["MLIP"].append(mlip_value)
-                        ads_data[adsorbate][classification]["MLIP_min"].append(MLIP_min)
-                        ads_data[adsorbate][classification]["MLIP_max"].append(MLIP_max)
-
-                        # Add to overall data
-                        ads_data["all"][classification]["DFT"].append(dft_value)
-                        ads_data["all"][classification]["MLIP"].append(mlip_value)
-                        ads_data["all"][classification]["MLIP_min"].append(MLIP_min)
-                        ads_data["all"][classification]["MLIP_max"].append(MLIP_max)
-                    except Exception as e:
-                        print(f"Error processing reaction {reaction}: {str(e)}")
-                        continue
+        # Process each reaction
+        for reaction in mlip_result:
+            if reaction == "calculation_settings":
+                continue
 
-                    # Accumulate time and steps (directly from saved results)
-                    time_accum += sum(
-                        value for key, value in mlip_result[reaction]["final"].items()
-                        if "time_total" in key
-                    )
+            adsorbate = reaction_adsorbates[reaction]
 
-                    step_accum += sum(
-                        value for key, value in mlip_result[reaction]["final"].items()
-                        if "steps_total" in key
-                    )
+            # Apply energy cutoff filter (only if cutoff is specified)
+            if self.energy_cutoff is not None:
+                try:
+                    reference_energy = mlip_result[reaction]["reference"]["ads_eng"]
+                    if reference_energy > self.energy_cutoff:
+                        continue  # Skip reactions with energy above cutoff
+                except (KeyError, TypeError):
+                    continue  # Skip if reference energy is not available
 
-                    # Count anomaly sub-categories. Gate on the reaction's final
-                    # classification so a reaction only contributes to its OWN
-                    # parent group's detail columns. The raw per-reaction flags can
-                    # be set for several groups at once, but classify_reaction
-                    # assigns a single exclusive bucket by priority -- counting the
-                    # raw flags ungated would leak a reaction into another group's
-                    # breakdown (e.g. a reproduction_failure also showing up in the
-                    # unphysical-relaxation detail columns).
-                    reaction_anomalies = anomaly_summary[reaction]["details"]
-
-                    if classification == "unphysical_relaxation":
-                        if absolute_energy_MLIP and reaction_anomalies["slab_conv"]:
-                            slab_conv += 1
-                        if reaction_anomalies["ads_conv"]:
-                            ads_conv += 1
-                        if absolute_energy_MLIP and reaction_anomalies["slab_move"]:
-                            slab_move += 1
-                        if reaction_anomalies["ads_move"]:
-                            ads_move += 1
-                    elif classification == "reproduction_failure":
-                        if absolute_energy_MLIP and reaction_anomalies["slab_seed"]:
-                            slab_seed += 1
-                        if absolute_energy_MLIP and reaction_anomalies["ads_seed"]:
-                            ads_seed += 1
-                        if reaction_anomalies["ads_eng_seed"]:
-                            ads_eng_seed += 1
-                        
-            # Convert lists to numpy arrays for all categories
-            for category in ads_data:
-                for classification in ads_data[category]:
-                    for key in ads_data[category][classification]:
-                        ads_data[category][classification][key] = np.array(ads_data[category][classification][key])
-
-            # Cache the mlip_result for later use in Excel generation
-            self._mlip_result_cache[mlip_name] = mlip_result
-
-            # Generate plots and calculate MAEs
-            all_dft_arrays = [ads_data["all"]["normal"]["DFT"]]
-            for anomaly_type in ["energy_anomaly", "adsorbate_migration", "unphysical_relaxation", "reproduction_failure"]:
-                all_dft_arrays.append(ads_data["all"][anomaly_type]["DFT"])
-
-            # Filter out empty arrays before concatenation
-            non_empty_arrays = [arr for arr in all_dft_arrays if len(arr) > 0]
-            DFT_data = np.concatenate(non_empty_arrays) if non_empty_arrays else np.array([])
-            if len(DFT_data) > 0:
-                if self.min_value is None or self.max_value is None:
-                    min_value, max_value = min_max(DFT_data)
-                    if self.min_value is not None:
-                        min_value = self.min_value
-                    if self.max_value is not None:
-                        max_value = self.max_value
-                else:
-                    min_value, max_value = self.min_value, self.max_value
-
-                # Re-sort adsorbates by data count for consistent ordering across all
-                # plots, with an alphabetical tiebreak for deterministic ordering on ties.
-                analysis_adsorbates = sorted(analysis_adsorbates, key=lambda ads: (-self._get_adsorbate_count(ads, ads_data), ads))
-
-                # Create single calculation plots data with re-sorted adsorbates
-                single_data = self._create_single_data_structure(mlip_result, analysis_adsorbates)
-
-                if self.plot_enabled:
-                    print(f"  Generating plots for {self._display_mlip_name(mlip_name)}...")
-                    # Setup plot directories once
-                    plot_save_path, mono_path, multi_path = self._setup_plot(mlip_name)
-
-                    # Generate all plots
-                    MAE_total, MAE_normal, MAEs_total_multi, MAEs_normal_multi = self._plot_generator(
-                        ads_data, single_data, mlip_name, min_value, max_value, mono_path, multi_path
-                    )
-                else:
-                    print(f"  Skipping plot generation for {self._display_mlip_name(mlip_name)} (plot_enabled=False)")
-                    # Calculate MAEs without generating plots
-                    MAE_total = self._calculate_mae_from_data(ads_data, ["normal", "adsorbate_migration", "energy_anomaly", "unphysical_relaxation", "reproduction_failure"])
-                    MAE_normal = self._calculate_mae_from_data(ads_data, ["normal"])
+            if adsorbate and adsorbate in analysis_adsorbates:
+                if adsorbate not in ads_data:
+                    ads_data[adsorbate] = {
+                        "normal": {"DFT": [], "MLIP": [], 
+                                 "MLIP_min": [], "MLIP_max": []},
+                        "energy_anomaly": {"DFT": [], "MLIP": [], 
+                                         "MLIP_min": [], "MLIP_max": []},
+                        "adsorbate_migration": {"DFT": [], "MLIP": [], 
+                                              "MLIP_min": [], "MLIP_max": []},
+                        "unphysical_relaxation": {"DFT": [], "MLIP": [], 
+                                                "MLIP_min": [], "MLIP_max": []},
+                        "reproduction_failure": {"DFT": [], "MLIP": [], 
+                                               "MLIP_min": [], "MLIP_max": []},
+                    }
+
+                # Bind the per-reaction sub-dicts once for the lookups below
+                reaction_result = mlip_result[reaction]
+                reaction_summary = anomaly_summary[reaction]
+                classification = reaction_summary["classification"]
+                MLIP_min, MLIP_max = get_ads_eng_range(reaction_result)
 
-                    MAEs_total_multi = self._calculate_maes_by_adsorbate(ads_data, ["normal", "adsorbate_migration", "energy_anomaly", "unphysical_relaxation", "reproduction_failure"], analysis_adsorbates)
-                    MAEs_normal_multi = self._calculate_maes_by_adsorbate(ads_data, ["normal"], analysis_adsorbates)
+                try:
+                    # Add data to appropriate classification category
+                    final = reaction_result["final"]
+                    dft_value = reaction_result["reference"]["ads_eng"]
+                    mlip_value = final["ads_eng_median"]
+
+                    # Add to adsorbate-specific and overall data
+                    for bucket in (ads_data[adsorbate][classification],
+                                   ads_data["all"][classification]):
+                        bucket["DFT"].append(dft_value)
+                        bucket["MLIP"].append(mlip_value)
+                        bucket["MLIP_min"].append(MLIP_min)
+                        bucket["MLIP_max"].append(MLIP_max)
+                except Exception as e:
+                    print(f"Error processing reaction {reaction}: {str(e)}")
+                    continue
 
-                # Calculate single MAE (using single_calculation vs reference)
-                single_mae = self._calculate_single_mae(mlip_result, analysis_adsorbates)
+                # Accumulate time and steps (directly from saved results)
+                for key, value in final.items():
+                    if "time_total" in key:
+                        time_accum += value
+                    elif "steps_total" in key:
+                        step_accum += value
+
+                # Count anomaly sub-categories. Gate on the reaction's final
+                # classification so a reaction only contributes to its OWN
+                # parent group's detail columns. The raw per-reaction flags can
+                # be set for several groups at once, but classify_reaction
+                # assigns a single exclusive bucket by priority -- counting the
+                # raw flags ungated would leak a reaction into another group's
+                # breakdown (e.g. a reproduction_failure also showing up in the
+                # unphysical-relaxation detail columns).
+                reaction_anomalies = reaction_summary["details"]
+
+                if classification == "unphysical_relaxation":
+                    if absolute_energy_MLIP and reaction_anomalies["slab_conv"]:
+                        slab_conv += 1
+                    if reaction_anomalies["ads_conv"]:
+                        ads_conv += 1
+                    if absolute_energy_MLIP and reaction_anomalies["slab_move"]:
+                        slab_move += 1
+                    if reaction_anomalies["ads_move"]:
+                        ads_move += 1
+                elif classification == "reproduction_failure":
+                    if absolute_energy_MLIP and reaction_anomalies["slab_seed"]:
+                        slab_seed += 1
+                    if absolute_energy_MLIP and reaction_anomalies["ads_seed"]:
+                        ads_seed += 1
+                    if reaction_anomalies["ads_eng_seed"]:
+                        ads_eng_seed += 1
+
+        # Convert lists to float arrays for all categories (known length and
+        # dtype, so each array is allocated once without type inference)
+        for buckets in ads_data.values():
+            for fields in buckets.values():
+                for key, values in fields.items():
+                    fields[key] = np.fromiter(values, dtype=np.float64, count=len(values))
+
+        # Generate plots and calculate MAEs
+        all_dft_arrays = [ads_data["all"]["normal"]["DFT"]]
+        for anomaly_type in ["energy_anomaly", "adsorbate_migration", "unphysical_relaxation", "reproduction_failure"]:
+            all_dft_arrays.append(ads_data["all"][anomaly_type]["DFT"])
+
+        # Axis limits only need each category's extremes, so reduce the
+        # arrays in place instead of concatenating them into a new one
+        non_empty_arrays = [arr for arr in all_dft_arrays if len(arr) > 0]
+        if non_empty_arrays:
+            if self.min_value is None or self.max_value is None:
+                min_value, max_value = min_max(
+                    [np.min(arr) for arr in non_empty_arrays]
+                    + [np.max(arr) for arr in non_empty_arrays]
+                )
+                if self.min_value is not None:
+                    min_value = self.min_value
+                if self.max_value is not None:
+                    max_value = self.max_value
+            else:
+                min_value, max_value = self.min_value, self.max_value
 
-                # Calculate single MAE by adsorbate for MLIP sheet
-                single_mae_by_adsorbate = self._calculate_single_mae_by_adsorbate(mlip_result, analysis_adsorbates)
+            # Re-sort adsorbates by data count for consistent ordering across all
+            # plots, with an alphabetical tiebreak for deterministic ordering on ties.
+            analysis_adsorbates = sorted(analysis_adsorbates, key=lambda ads: (-self._get_adsorbate_count(ads, ads_data), ads))
+            outcome["analysis_adsorbates"] = analysis_adsorbates
 
-                # Calculate ADwT and AMDwT metrics
-                print(f"  Calculating ADwT metric for {self._display_mlip_name(mlip_name)}...")
-                adwt_value = self._calculate_adwt(mlip_result, analysis_adsorbates)
-                # Cache ADwT calculations for each adsorbate
-                for adsorbate in analysis_adsorbates:
-                    cache_key = (mlip_name, adsorbate)
-                    if cache_key not in self._adwt_cache:
-                        self._adwt_cache[cache_key] = self._calculate_adwt_by_adsorbate(mlip_result, adsorbate)
+            # Create single calculation plots data with re-sorted adsorbates
+            single_data = self._create_single_data_structure(mlip_result, analysis_adsorbates)
 
-                print(f"  Calculating AMDwT metric for {self._display_mlip_name(mlip_name)}...")
-                amdwt_value = self._calculate_amdwt(mlip_result, analysis_adsorbates)
-                # Cache AMDwT calculations for each adsorbate
-                for adsorbate in analysis_adsorbates:
-                    cache_key = (mlip_name, adsorbate)
-                    if cache_key not in self._amdwt_cache:
-                        self._amdwt_cache[cache_key] = self._calculate_amdwt_by_adsorbate(mlip_result, adsorbate)
-
-                MLIP_datas[mlip_name] = {
-                    "total": MAEs_total_multi,
-                    "normal": MAEs_normal_multi,
-                    "single_mae": single_mae_by_adsorbate,
-                    "ads_data": ads_data,  # Add full ads_data for anomaly breakdown
-                }
+            if self.plot_enabled:
+                print(f"  Generating plots for {self._display_mlip_name(mlip_name)}...")
+                # Setup plot directories once
+                plot_save_path, mono_path, multi_path = self._setup_plot(mlip_name)
 
-                # Prepare main data  
-                normal_count = len(ads_data["all"]["normal"]["DFT"])
-                # Anomaly count excludes adsorbate migration (now independent category)
-                anomaly_count = (len(ads_data["all"]["energy_anomaly"]["DFT"]) + 
-                               len(ads_data["all"]["unphysical_relaxation"]["DFT"]) + 
-                               len(ads_data["all"]["reproduction_failure"]["DFT"]))
-                total_num = normal_count + anomaly_count + len(ads_data["all"]["adsorbate_migration"]["DFT"])
-                anomaly_rate = (anomaly_count / total_num) * 100 if total_num > 0 else 0
-
-                # Calculate individual anomaly rates
-                reproduction_failure_rate = (len(ads_data["all"]["reproduction_failure"]["DFT"]) / total_num) * 100 if total_num > 0 else 0
-                unphysical_relaxation_rate = (len(ads_data["all"]["unphysical_relaxation"]["DFT"]) / total_num) * 100 if total_num > 0 else 0
-                adsorbate_migration_rate = (len(ads_data["all"]["adsorbate_migration"]["DFT"]) / total_num) * 100 if total_num > 0 else 0
-                energy_anomaly_rate = (len(ads_data["all"]["energy_anomaly"]["DFT"]) / total_num) * 100 if total_num > 0 else 0
-                normal_rate = (normal_count / total_num) * 100 if total_num > 0 else 0
-
-                main_data.append({
-                    "MLIP_name": self._display_mlip_name(mlip_name),
-                    "Normal_rate": normal_rate,
-                    "Anomaly_rate": anomaly_rate,
-                    "Reproduction_failure_rate": reproduction_failure_rate,
-                    "Unphysical_relaxation_rate": unphysical_relaxation_rate,
-                    "Adsorbate_migration_rate": adsorbate_migration_rate,
-                    "Energy_anomaly_rate": energy_anomaly_rate,
-                    "MAE_total": MAE_total,
-                    "MAE_normal": MAE_normal,
-                    "MAE_single": single_mae,
-                    "ADwT": adwt_value,
-                    "AMDwT": amdwt_value,
-                    "Num_total": total_num,
-                    "Time_total": time_accum,
-                    "Time_per_step": time_accum / step_accum if step_accum > 0 else 0,
-                    "Steps_total": step_accum,
-                })
+                # Generate all plots
+                MAE_total, MAE_normal, MAEs_total_multi, MAEs_normal_multi = self._plot_generator(
+                    ads_data, single_data, mlip_name, min_value, max_value, mono_path, multi_path
+                )
+            else:
+                print(f"  Skipping plot generation for {self._display_mlip_name(mlip_name)} (plot_enabled=False)")
+                # Calculate MAEs without generating plots
+                MAE_total = self._calculate_mae_from_data(ads_data, ["normal", "adsorbate_migration", "energy_anomaly", "unphysical_relaxation", "reproduction_failure"])
+                MAE_normal = self._calculate_mae_from_data(ads_data, ["normal"])
+
+                MAEs_total_multi = self._calculate_maes_by_adsorbate(ads_data, ["normal", "adsorbate_migration", "energy_anomaly", "unphysical_relaxation", "reproduction_failure"], analysis_adsorbates)
+                MAEs_normal_multi = self._calculate_maes_by_adsorbate(ads_data, ["normal"], analysis_adsorbates)
+
+            # Calculate single MAE (using single_calculation vs reference)
+            single_mae = self._calculate_single_mae(mlip_result, analysis_adsorbates)
+
+            # Calculate single MAE by adsorbate for MLIP sheet
+            single_mae_by_adsorbate = self._calculate_single_mae_by_adsorbate(mlip_result, analysis_adsorbates)
+
+            # Calculate ADwT and AMDwT metrics
+            print(f"  Calculating ADwT metric for {self._display_mlip_name(mlip_name)}...")
+            adwt_value = self._calculate_adwt(mlip_result, analysis_adsorbates)
+            # Cache ADwT calculations for each adsorbate
+            for adsorbate in analysis_adsorbates:
+                cache_key = (mlip_name, adsorbate)
+                if cache_key not in self._adwt_cache:
+                    self._adwt_cache[cache_key] = self._calculate_adwt_by_adsorbate(mlip_result, adsorbate)
+                outcome["adwt_cache"][cache_key] = self._adwt_cache[cache_key]
+
+            print(f"  Calculating AMDwT metric for {self._display_mlip_name(mlip_name)}...")
+            amdwt_value = self._calculate_amdwt(mlip_result, analysis_adsorbates)
+            # Cache AMDwT calculations for each adsorbate
+            for adsorbate in analysis_adsorbates:
+                cache_key = (mlip_name, adsorbate)
+                if cache_key not in self._amdwt_cache:
+                    self._amdwt_cache[cache_key] = self._calculate_amdwt_by_adsorbate(mlip_result, adsorbate)
+                outcome["amdwt_cache"][cache_key] = self._amdwt_cache[cache_key]
+
+            outcome["mlip_data"] = {
+                "total": MAEs_total_multi,
+                "normal": MAEs_normal_multi,
+                "single_mae": single_mae_by_adsorbate,
+                "ads_data": ads_data,  # Add full ads_data for anomaly breakdown
+            }
 
-                # Prepare anomaly data with specified order
-                anomaly_data_dict = {
-                    "MLIP_name": self._display_mlip_name(mlip_name),
-                    "Num_normal": normal_count,
-                    "Num_anomaly_total": anomaly_count,
-                    "Num_reproduction_failure": len(ads_data["all"]["reproduction_failure"]["DFT"]),
-                    "Num_unphysical_relaxation": len(ads_data["all"]["unphysical_relaxation"]["DFT"]),
-                    "Num_adsorbate_migration": len(ads_data["all"]["adsorbate_migration"]["DFT"]),
-                    "Num_energy_anomaly": len(ads_data["all"]["energy_anomaly"]["DFT"]),
-                    # Reproduction failure breakdown
-                    "ads_eng_seed": ads_eng_seed,
-                    "ads_seed": ads_seed if absolute_energy_MLIP else 0,
-                    "slab_seed": slab_seed if absolute_energy_MLIP else 0,
-                    # Unphysical relaxation breakdown
-                    "ads_conv": ads_conv,
-                    "ads_move": ads_move,
-                    "slab_conv": slab_conv if absolute_energy_MLIP else 0,
-                    "slab_move": slab_move if absolute_energy_MLIP else 0,
-                }
+            # Prepare main data  
+            normal_count = len(ads_data["all"]["normal"]["DFT"])
+            # Anomaly count excludes adsorbate migration (now independent category)
+            anomaly_count = (len(ads_data["all"]["energy_anomaly"]["DFT"]) + 
+                           len(ads_data["all"]["unphysical_relaxation"]["DFT"]) + 
+                           len(ads_data["all"]["reproduction_failure"]["DFT"]))
+            total_num = normal_count + anomaly_count + len(ads_data["all"]["adsorbate_migration"]["DFT"])
+            anomaly_rate = (anomaly_count / total_num) * 100 if total_num > 0 else 0
+
+            # Calculate individual anomaly rates
+            reproduction_failure_rate = (len(ads_data["all"]["reproduction_failure"]["DFT"]) / total_num) * 100 if total_num > 0 else 0
+            unphysical_relaxation_rate = (len(ads_data["all"]["unphysical_relaxation"]["DFT"]) / total_num) * 100 if total_num > 0 else 0
+            adsorbate_migration_rate = (len(ads_data["all"]["adsorbate_migration"]["DFT"]) / total_num) * 100 if total_num > 0 else 0
+            energy_anomaly_rate = (len(ads_data["all"]["energy_anomaly"]["DFT"]) / total_num) * 100 if total_num > 0 else 0
+            normal_rate = (normal_count / total_num) * 100 if total_num > 0 else 0
+
+            outcome["main"] = {
+                "MLIP_name": self._display_mlip_name(mlip_name),
+                "Normal_rate": normal_rate,
+                "Anomaly_rate": anomaly_rate,
+                "Reproduction_failure_rate": reproduction_failure_rate,
+                "Unphysical_relaxation_rate": unphysical_relaxation_rate,
+                "Adsorbate_migration_rate": adsorbate_migration_rate,
+                "Energy_anomaly_rate": energy_anomaly_rate,
+                "MAE_total": MAE_total,
+                "MAE_normal": MAE_normal,
+                "MAE_single": single_mae,
+                "ADwT": adwt_value,
+                "AMDwT": amdwt_value,
+                "Num_total": total_num,
+                "Time_total": time_accum,
+                "Time_per_step": time_accum / step_accum if step_accum > 0 else 0,
+                "Steps_total": step_accum,
+            }
 
-                anomaly_data.append(anomaly_data_dict)
+            # Prepare anomaly data with specified order
+            anomaly_data_dict = {
+                "MLIP_name": self._display_mlip_name(mlip_name),
+                "Num_normal": normal_count,
+                "Num_anomaly_total": anomaly_count,
+                "Num_reproduction_failure": len(ads_data["all"]["reproduction_failure"]["DFT"]),
+                "Num_unphysical_relaxation": len(ads_data["all"]["unphysical_relaxation"]["DFT"]),
+                "Num_adsorbate_migration": len(ads_data["all"]["adsorbate_migration"]["DFT"]),
+                "Num_energy_anomaly": len(ads_data["all"]["energy_anomaly"]["DFT"]),
+                # Reproduction failure breakdown
+                "ads_eng_seed": ads_eng_seed,
+                "ads_seed": ads_seed if absolute_energy_MLIP else 0,
+                "slab_seed": slab_seed if absolute_energy_MLIP else 0,
+                # Unphysical relaxation breakdown
+                "ads_conv": ads_conv,
+                "ads_move": ads_move,
+                "slab_conv": slab_conv if absolute_energy_MLIP else 0,
+                "slab_move": slab_move if absolute_energy_MLIP else 0,
+            }
 
-        # Create Excel output
-        self._create_excel_output(main_data, anomaly_data, MLIP_datas, list(analysis_adsorbates))
+            outcome["anomaly"] = anomaly_data_dict
 
+        return outcome
 
     def _create_single_data_structure(self, mlip_result, analysis_adsorbates):
         """Create data structure for single calculation plotting."""
@@ -1628,19 +1720,16 @@ class AdsorptionAnalysis:
                 dft_value = mlip_result[reaction]["reference"]["ads_eng"]
                 mlip_value = mlip_result[reaction]["single_calculation"]["ads_eng"]
 
-                # Add to all data
-                single_data["all"]["all"]["DFT"].append(dft_value)
-                single_data["all"]["all"]["MLIP"].append(mlip_value)
-
-                # Add to adsorbate-specific data
-                single_data[adsorbate]["all"]["DFT"].append(dft_value)
-                single_data[adsorbate]["all"]["MLIP"].append(mlip_value)
+                # Add to all data and adsorbate-specific data
+                for bucket in (single_data["all"]["all"], single_data[adsorbate]["all"]):
+                    bucket["DFT"].append(dft_value)
+                    bucket["MLIP"].append(mlip_value)
 
-        # Convert lists to numpy arrays
-        for category in single_data:
-            for subcategory in single_data[category]:
-                for key in single_data[category][subcategory]:
-                    single_data[category][subcategory][key] = np.array(single_data[category][subcategory][key])
+        # Convert lists to float arrays
+        for buckets in single_data.values():
+            for fields in buckets.values():
+                for key, values in fields.items():
+                    fields[key] = np.fromiter(values, dtype=np.float64, count=len(values))
 
         return single_data
 
@@ -1679,6 +1768,12 @@ class AdsorptionAnalysis:
     def _calculate_single_mae_by_adsorbate(self, mlip_result, analysis_adsorbates):
         """Calculate MAE for single-point calculations vs reference by adsorbate."""
         adsorbate_mae = {}
+        # Resolved once, not once per target adsorbate
+        reaction_adsorbates = {
+            reaction: find_adsorbate(mlip_result[reaction]["reference"])
+            for reaction in mlip_result
+            if reaction != "calculation_settings"
+        }
 
         for target_adsorbate in analysis_adsorbates:
             dft_values = []
@@ -1688,7 +1783,7 @@ class AdsorptionAnalysis:
                 if reaction == "calculation_settings":
                     continue
 
-                adsorbate = find_adsorbate(mlip_result[reaction]["reference"])
+                adsorbate = reaction_adsorbates[reaction]
 
                 # Apply energy cutoff filter (only if cutoff is specified)
                 if self.energy_cutoff is not None:
@@ -2046,22 +2141,30 @@ class AdsorptionAnalysis:
         if len(single_data["all"]["all"]["DFT"]) > 0:
             plot_data_cache["single"] = prepare_plot_data(single_data, ["all"])
 
-        # Generate mono plots with pre-computed data
-        MAE_total = self.mono_plotter(ads_data, mlip_name, "total", min_value, max_value, mono_path, plot_data_cache.get("total"))
-        MAE_normal = self.mono_plotter(ads_data, mlip_name, "normal", min_value, max_value, mono_path, plot_data_cache.get("normal"))
-        self.mono_plotter(ads_data, mlip_name, "migration", min_value, max_value, mono_path, plot_data_cache.get("migration"))
-        self.mono_plotter(ads_data, mlip_name, "anomaly", min_value, max_value, mono_path, plot_data_cache.get("anomaly"))
-
-        # Generate multi plots
-        MAEs_total_multi = self.multi_plotter(ads_data, mlip_name, plot_configs["total"], "total", min_value, max_value, multi_path)
-        MAEs_normal_multi = self.multi_plotter(ads_data, mlip_name, plot_configs["normal"], "normal", min_value, max_value, multi_path)
-        self.multi_plotter(ads_data, mlip_name, plot_configs["migration"], "migration", min_value, max_value, multi_path)
-        self.multi_plotter(ads_data, mlip_name, plot_configs["anomaly"], "anomaly", min_value, max_value, multi_path)
-
-        # Single plots (if data exists)
-        if single_data and "single" in plot_data_cache:
-            self.mono_plotter(single_data, mlip_name, "single", min_value, max_value, mono_path, plot_data_cache.get("single"))
-            self.multi_plotter(single_data, mlip_name, ["all"], "single", min_value, max_value, multi_path)
+        # All parity plots of this MLIP share one Figure/Axes (cleared and
+        # re-styled per plot) instead of building and tearing down a Figure each.
+        self._shared_plot = plt.subplots(figsize=self.figsize)
+        self._legend_written.clear()
+        try:
+            # Generate mono plots with pre-computed data
+            MAE_total = self.mono_plotter(ads_data, mlip_name, "total", min_value, max_value, mono_path, plot_data_cache.get("total"))
+            MAE_normal = self.mono_plotter(ads_data, mlip_name, "normal", min_value, max_value, mono_path, plot_data_cache.get("normal"))
+            self.mono_plotter(ads_data, mlip_name, "migration", min_value, max_value, mono_path, plot_data_cache.get("migration"))
+            self.mono_plotter(ads_data, mlip_name, "anomaly", min_value, max_value, mono_path, plot_data_cache.get("anomaly"))
+
+            # Generate multi plots
+            MAEs_total_multi = self.multi_plotter(ads_data, mlip_name, plot_configs["total"], "total", min_value, max_value, multi_path)
+            MAEs_normal_multi = self.multi_plotter(ads_data, mlip_name, plot_configs["normal"], "normal", min_value, max_value, multi_path)
+            self.multi_plotter(ads_data, mlip_name, plot_configs["migration"], "migration", min_value, max_value, multi_path)
+            self.multi_plotter(ads_data, mlip_name, plot_configs["anomaly"], "anomaly", min_value, max_value, multi_path)
+
+            # Single plots (if data exists)
+            if single_data and "single" in plot_data_cache:
+                self.mono_plotter(single_data, mlip_name, "single", min_value, max_value, mono_path, plot_data_cache.get("single"))
+                self.multi_plotter(single_data, mlip_name, ["all"], "single", min_value, max_value, multi_path)
+        finally:
+            plt.close(self._shared_plot[0])
+            self._shared_plot = None
 
         return MAE_total, MAE_normal, MAEs_total_multi, MAEs_normal_multi
 
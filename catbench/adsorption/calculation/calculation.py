@@ -6,10 +6,13 @@ adsorption energy benchmarking calculations with MLIPs.
 """
 
 import json
+import multiprocessing
 import os
 import shutil
+import sys
 import traceback
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 from ase.geometry import find_mic
@@ -18,15 +21,47 @@ from ase.io import write
 from catbench.config import CALCULATION_DEFAULTS, get_default
 from catbench.utils.calculation_utils import (
     energy_cal_gas, energy_cal_single, energy_cal,
-    calc_displacement, find_median_index, get_fixed_indices, NumpyEncoder
+    calc_displacement, find_median_index, get_fixed_indices, get_optimizer_class,
+    NumpyEncoder
 )
 from catbench.utils.io_utils import (
     create_calculation_directories, get_result_directory, get_raw_data_path,
-    load_existing_results, save_calculation_results, get_calculation_settings
+    load_existing_results, save_calculation_results, save_gas_energies,
+    append_result_journal, get_calculation_settings
 )
 from catbench.utils.structure_dedup import reuse_key
 
 
+# State shared with forked worker processes when n_workers > 1. Set in the parent
+# right before the pool forks so workers inherit it copy-on-write.
+_WORKER_STATE = {}
+
+
+def _worker_init():
+    """Pin each worker's torch intra-op pool to one thread so n_workers processes
+    do not oversubscribe the cores. BLAS/OpenMP pools are already sized in the
+    parent before the fork, so their environment variables have no effect here."""
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(1)
+
+
+def _worker_run_reaction(index, key):
+    """Process one reaction inside a worker; return its outcome plus the cache
+    entries it added so the parent can merge them."""
+    state = _WORKER_STATE
+    caches = state["caches"]
+    before = [set(cache) for cache in caches]
+    key, reaction_result, failure = state["calc"]._attempt_reaction(
+        state["mode"], index, key, state["ref_data"], state["save_directory"], caches
+    )
+    cache_updates = [
+        {k: v for k, v in cache.items() if k not in seen}
+        for cache, seen in zip(caches, before)
+    ]
+    return key, reaction_result, failure, cache_updates
+
+
 class AdsorptionCalculation:
     """
     Adsorption energy calculation class for MLIP benchmarking.
@@ -55,6 +90,8 @@ class AdsorptionCalculation:
     Output Files:
         - JSON result files: {MLIP_name}_result.json with detailed calculation data
         - JSON gas files: {MLIP_name}_gases.json with gas molecule energies
+        - Journal file: {MLIP_name}_result.jsonl with reactions finished since the
+          last save_step checkpoint (folded back in on restart, removed on save)
         - Trajectory files: ASE trajectory files in extxyz format
         - Log files: Detailed calculation logs for each structure
         
@@ -66,9 +103,13 @@ class AdsorptionCalculation:
         f_crit_relax (float, optional): Force convergence criterion in eV/Å. Default: 0.05
         n_crit_relax (int, optional): Maximum optimization steps. Default: 999
         rate (float, optional): If set, fixes the bottom `rate` fraction of atoms by z-coordinate (legacy override). Default None = use the structure's stored FixAtoms constraints.
-        damping (float, optional): Damping factor for optimization. Default: 1.0
+        damping (float, optional): Damping factor passed to LBFGS / LBFGSLineSearch
+                                   (ignored by other optimizers). Default: 1.0
         optimizer (str, optional): ASE optimizer name. Default: "LBFGS"
         save_step (int, optional): Save results every N calculations. Default: 50
+        n_workers (int, optional): Number of reactions processed in parallel by a
+                                   fork-based process pool. Keep at 1 for CUDA
+                                   calculators (CUDA does not survive fork). Default: 1
         
     Raises:
         ValueError: If mode is not valid or required parameters are missing.
@@ -136,6 +177,8 @@ class AdsorptionCalculation:
         for key, default_value in CALCULATION_DEFAULTS.items():
             if key not in self.config:
                 self.config[key] = get_default(key, CALCULATION_DEFAULTS)
+        # Fail at construction, not after data loading / the first relaxation
+        get_optimizer_class(self.config["optimizer"])
 
     def _relax_sig(self):
         """Signature of the settings that determine a relaxation result. The slab
@@ -222,38 +265,26 @@ class AdsorptionCalculation:
         failed = {}
 
         print("Starting calculations...")
-        for index, key in enumerate(ref_data):
-            # Skip if already calculated
-            if key in final_result:
-                print(f"Skipping already calculated {key}")
+        pending = self._pending_reactions(ref_data, final_result)
+        caches = (gas_energies, gas_energies_single, structure_cache)
+        n_gas_cached = len(gas_energies) + len(gas_energies_single)
+        for key, reaction_result, failure in self._iter_reactions("basic", ref_data, pending, save_directory, caches):
+            # Persist newly relaxed gases right away rather than at the next
+            # save_step checkpoint: a gas relaxation is costly and shared by many
+            # reactions, so a restart should never have to redo one.
+            if len(gas_energies) + len(gas_energies_single) != n_gas_cached:
+                save_gas_energies(save_directory, self.mlip_name, gas_energies, gas_energies_single)
+                n_gas_cached = len(gas_energies) + len(gas_energies_single)
+            if failure is not None:
+                failed[key] = failure
                 continue
+            final_result[key] = reaction_result
+            append_result_journal(save_directory, self.mlip_name, key, reaction_result)
 
-            # Clean up any incomplete attempts (only if save_files is True)
-            if self.config.get("save_files", True):
-                log_path = f"{save_directory}/log/{key}"
-                traj_path = f"{save_directory}/traj/{key}"
-                if os.path.exists(log_path):
-                    shutil.rmtree(log_path)
-                    print(f"Removed existing log directory for {key}")
-                if os.path.exists(traj_path):
-                    shutil.rmtree(traj_path)
-                    print(f"Removed existing trajectory directory for {key}")
-            
-            try:
-                print(f"[{index+1}/{len(ref_data)}] {key}")
-                result = self._process_reaction_basic(key, ref_data[key], save_directory, gas_energies, gas_energies_single, structure_cache)
-                final_result[key] = result["reaction_result"]
-
-                # Save results every save_step calculations
-                if len(final_result) % self.config["save_step"] == 0:
-                    print(f"Saving results at {len(final_result)} calculations...")
-                    self._save_results_basic(save_directory, final_result, gas_energies, gas_energies_single, structure_cache, failed)
-
-            except Exception as e:
-                print(f"Error occurred while processing {key}: {str(e)}")
-                print("Skipping to next reaction...")
-                failed[key] = {"error": repr(e), "traceback": traceback.format_exc()[-2000:]}
-                continue
+            # Save results every save_step calculations
+            if len(final_result) % self.config["save_step"] == 0:
+                print(f"Saving results at {len(final_result)} calculations...")
+                self._save_results_basic(save_directory, final_result, gas_energies, gas_energies_single, structure_cache, failed, pretty=False)
 
         # Final save to ensure all results are saved
         print(f"Final save: {len(final_result)} total calculations")
@@ -264,7 +295,172 @@ class AdsorptionCalculation:
             print(f"Failed reactions: {list(failed.keys())}")
         print(f"{self.mlip_name} Benchmarking Finish")
         return save_directory
-    
+
+    def _pending_reactions(self, ref_data, final_result):
+        """List (index, key) of reactions still to be calculated, in dataset order."""
+        pending = []
+        for index, key in enumerate(ref_data):
+            # Skip if already calculated
+            if key in final_result:
+                print(f"Skipping already calculated {key}")
+                continue
+            pending.append((index, key))
+        return pending
+
+    def _attempt_reaction(self, mode, index, key, ref_data, save_directory, caches):
+        """
+        Run one reaction, converting any exception into a failure record.
+
+        Returns:
+            tuple: (key, reaction_result or None, failure dict or None)
+        """
+        # Clean up any incomplete attempts (only if save_files is True)
+        if mode == "basic" and self.config.get("save_files", True):
+            log_path = f"{save_directory}/log/{key}"
+            traj_path = f"{save_directory}/traj/{key}"
+            if os.path.exists(log_path):
+                shutil.rmtree(log_path)
+                print(f"Removed existing log directory for {key}")
+            if os.path.exists(traj_path):
+                shutil.rmtree(traj_path)
+                print(f"Removed existing trajectory directory for {key}")
+
+        try:
+            print(f"[{index+1}/{len(ref_data)}] {key}")
+            if mode == "basic":
+                result = self._process_reaction_basic(key, ref_data[key], save_directory, *caches)
+            else:
+                result = self._process_reaction_oc20(key, ref_data[key], save_directory)
+            return key, result["reaction_result"], None
+        except Exception as e:
+            print(f"Error occurred while processing {key}: {str(e)}")
+            print("Skipping to next reaction...")
+            return key, None, {"error": repr(e), "traceback": traceback.format_exc()[-2000:]}
+
+    def _iter_reactions(self, mode, ref_data, pending, save_directory, caches):
+        """
+        Yield (key, reaction_result, failure) for every pending reaction.
+
+        Reactions are independent, so with ``n_workers > 1`` they are dispatched
+        to a fork-based process pool. Workers inherit ``ref_data``, the
+        calculators and the caches copy-on-write (nothing is pickled on the way
+        in); each returns only the cache entries it added, which are merged into
+        the parent's caches here so checkpoints and a restarted run see them.
+        The merge does not reach the running workers, which all fork at the
+        first submit: only the gas entries set up by ``_prime_gas_caches`` are
+        shared, while slab/adslab reuse (``structure_cache``) happens within a
+        worker only, so frame-equivalent slabs may be relaxed once per worker.
+        Results are yielded in submission (dataset) order in both paths, so the
+        result file comes out in the same reaction order on every run.
+        """
+        n_workers = int(self.config.get("n_workers") or 1)
+        if n_workers > 1 and len(pending) > 1:
+            if "fork" in multiprocessing.get_all_start_methods():
+                yield from self._iter_reactions_parallel(
+                    mode, ref_data, pending, save_directory, caches, n_workers
+                )
+                return
+            warnings.warn(
+                "n_workers > 1 requires the 'fork' start method, which is not "
+                "available on this platform; running reactions serially.",
+                stacklevel=3,
+            )
+        for index, key in pending:
+            yield self._attempt_reaction(mode, index, key, ref_data, save_directory, caches)
+
+    def _iter_reactions_parallel(self, mode, ref_data, pending, save_directory, caches, n_workers):
+        """Process-pool backend for _iter_reactions (see there)."""
+        global _WORKER_STATE
+        # Never fork more workers than there are reactions: each idle worker
+        # still inherits a full copy of the calculator.
+        n_workers = min(n_workers, len(pending))
+        if mode == "basic":
+            self._prime_gas_caches(ref_data, pending, save_directory, *caches[:2])
+        _WORKER_STATE = {
+            "calc": self, "mode": mode, "ref_data": ref_data,
+            "save_directory": save_directory, "caches": caches,
+        }
+        print(f"Dispatching {len(pending)} reactions to {n_workers} worker processes")
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_worker_init,
+            ) as pool:
+                futures = [pool.submit(_worker_run_reaction, index, key) for index, key in pending]
+                for future in futures:
+                    key, reaction_result, failure, cache_updates = future.result()
+                    # First writer wins: an entry already in the parent is the
+                    # one earlier results were computed with, so keep it.
+                    for cache, update in zip(caches, cache_updates):
+                        for cache_key, value in update.items():
+                            cache.setdefault(cache_key, value)
+                    yield key, reaction_result, failure
+        finally:
+            _WORKER_STATE = {}
+
+    def _single_point_gas_energy(self, structure, system, gas_energies_single):
+        """Single-point energy of a gas with calculators[0], computed once and cached."""
+        gas_tag = structure  # Simplified: no suffix for single point
+        if gas_tag not in gas_energies_single:
+            print(f"{gas_tag} single point calculating")
+            # energy_cal_single works on atoms.copy(), which never carries
+            # the calculator over, so the reference structure is left intact
+            gas_energies_single[gas_tag] = energy_cal_single(self.calculators[0], system["atoms"])
+        return gas_energies_single[gas_tag]
+
+    def _relaxed_gas_energy(self, i, structure, system, save_directory, gas_energies):
+        """Energy of a gas relaxed with calculators[i], computed once and cached."""
+        gas_tag = f"{structure}_{i}th"
+        if gas_tag in gas_energies:
+            return gas_energies[gas_tag]
+        print(f"{gas_tag} calculating")
+        if self.config.get("save_files", True):
+            gas_CONTCAR, gas_energy = energy_cal_gas(
+                self.calculators[i],
+                system["atoms"],
+                self.config["f_crit_relax"],
+                f"{save_directory}/gases/POSCARs/POSCAR_{gas_tag}",
+                self.config["optimizer"],
+                f"{save_directory}/gases/log/{gas_tag}.txt",
+                f"{save_directory}/gases/traj/{gas_tag}",
+            )
+            write(f"{save_directory}/gases/CONTCARs/CONTCAR_{gas_tag}", gas_CONTCAR, format="vasp")
+        else:
+            gas_CONTCAR, gas_energy = energy_cal_gas(
+                self.calculators[i],
+                system["atoms"],
+                self.config["f_crit_relax"],
+                None,  # No save path
+                self.config["optimizer"],
+                None,  # No log path
+                None,  # No trajectory path
+            )
+        gas_energies[gas_tag] = gas_energy
+        return gas_energy
+
+    def _prime_gas_caches(self, ref_data, pending, save_directory, gas_energies, gas_energies_single):
+        """
+        Compute every gas energy the pending reactions need, in the parent.
+
+        Called before the pool forks so workers only read the gas caches; left
+        to the workers, two of them could relax the same molecule at once, write
+        the same gas files and each use its own energy. Gases are visited in
+        dataset order, so each is taken from the same reaction as in a serial
+        run. A gas that fails here stays uncached and fails its reactions in the
+        workers, as it would serially.
+        """
+        for _, key in pending:
+            for structure, system in ref_data[key]["raw"].items():
+                if "gas" not in structure:
+                    continue
+                try:
+                    self._single_point_gas_energy(structure, system, gas_energies_single)
+                    for i in range(len(self.calculators)):
+                        self._relaxed_gas_energy(i, structure, system, save_directory, gas_energies)
+                except Exception as e:
+                    print(f"Error occurred while calculating {structure}: {str(e)}")
+
     def _process_reaction_basic(self, key, reaction_data, save_directory, gas_energies, gas_energies_single, structure_cache):
         """
         Process a single adsorption reaction in basic mode.
@@ -293,9 +489,9 @@ class AdsorptionCalculation:
         }
         
         # Add reference energies
-        for structure in reaction_data["raw"]:
-            if "gas" not in str(structure):
-                result["reference"][f"{structure}_tot_eng"] = reaction_data["raw"][structure]["energy_ref"]
+        for structure, system in reaction_data["raw"].items():
+            if "gas" not in structure:
+                result["reference"][f"{structure}_tot_eng"] = system["energy_ref"]
         
         # Add adsorbate indices right after reference
         result["adsorbate_indices"] = adsorbate_indices
@@ -305,13 +501,13 @@ class AdsorptionCalculation:
         slab_energy_single = None
         adslab_energy_single = None
         
-        for structure in reaction_data["raw"]:
-            if "gas" not in str(structure):
-                POSCAR_str = reaction_data["raw"][structure]["atoms"]
+        for structure, system in reaction_data["raw"].items():
+            if "gas" not in structure:
+                POSCAR_str = system["atoms"]
                 if structure == "star":
                     # Single-point clean-slab energy is frame-invariant -> cache &
                     # reuse across frame-equivalent slabs (key tagged '|sp', calc[0]).
-                    sp_key = f"{reuse_key(POSCAR_str, reaction_data['raw'][structure].get('energy_ref'))}|sp"
+                    sp_key = f"{reuse_key(POSCAR_str, system.get('energy_ref'))}|sp"
                     if self.config.get("structure_cache", True) and sp_key in structure_cache:
                         energy_calculated = structure_cache[sp_key]
                     else:
@@ -322,21 +518,9 @@ class AdsorptionCalculation:
                 else:
                     energy_calculated = energy_cal_single(self.calculators[0], POSCAR_str)
                     adslab_energy_single = energy_calculated
-                ads_energy_single += energy_calculated * reaction_data["raw"][structure]["stoi"]
             else:  # Gas molecule - use single point
-                gas_tag = structure  # Simplified: no suffix for single point
-                if gas_tag in gas_energies_single:
-                    ads_energy_single += gas_energies_single[gas_tag] * reaction_data["raw"][structure]["stoi"]
-                else:
-                    print(f"{gas_tag} single point calculating")
-                    gas_atoms = reaction_data["raw"][structure]["atoms"]
-                    # Remove calculator if it exists to prevent deepcopy issues
-                    if hasattr(gas_atoms, 'calc'):
-                        gas_atoms.calc = None
-                    # Now use energy_cal_single which will deepcopy safely
-                    gas_energy = energy_cal_single(self.calculators[0], gas_atoms)
-                    gas_energies_single[gas_tag] = gas_energy
-                    ads_energy_single += gas_energy * reaction_data["raw"][structure]["stoi"]
+                energy_calculated = self._single_point_gas_energy(structure, system, gas_energies_single)
+            ads_energy_single += energy_calculated * system["stoi"]
         
         result["single_calculation"] = {
             "ads_eng": ads_energy_single,
@@ -379,9 +563,13 @@ class AdsorptionCalculation:
         # The geometry fingerprint is O(n_atoms^2) and identical across seeds, so
         # computing it inside the seed loop would repeat it (n_seeds - 1)x.
         reuse_keys = {
-            s: reuse_key(reaction_data["raw"][s]["atoms"],
-                         reaction_data["raw"][s].get("energy_ref"))
-            for s in reaction_data["raw"] if "gas" not in str(s)
+            s: reuse_key(system["atoms"], system.get("energy_ref"))
+            for s, system in reaction_data["raw"].items() if "gas" not in s
+        }
+        # Fixed-atom indices are data-defined (stored FixAtoms) and likewise
+        # seed-independent; resolve them once per structure, not per calculator.
+        fixed_indices_by_structure = {
+            s: get_fixed_indices(reaction_data["raw"][s]["atoms"]) for s in reuse_keys
         }
 
         # Run calculations for each calculator
@@ -399,13 +587,13 @@ class AdsorptionCalculation:
             cached_max_bond_change = None
             cached_substrate_disp = None
 
-            for structure in reaction_data["raw"]:
-                if "gas" not in str(structure) and structure == "star":
+            for structure, system in reaction_data["raw"].items():
+                if structure == "star":
                     # Clean slab: relax once per (geometry+fix, seed) and reuse the
                     # result for every frame-equivalent slab (energy + displacement
                     # are frame-invariant -> identical result, pure speedup).
-                    POSCAR_str = reaction_data["raw"][structure]["atoms"]
-                    fixed_indices = get_fixed_indices(POSCAR_str)
+                    POSCAR_str = system["atoms"]
+                    fixed_indices = fixed_indices_by_structure[structure]
                     slab_key = f"{reuse_keys[structure]}_{i}th"
                     cached = structure_cache.get(slab_key) if self.config.get("structure_cache", True) else None
                     if cached is not None:
@@ -449,7 +637,7 @@ class AdsorptionCalculation:
                                 "slab_pos_rmsd": slab_displacement_stats["rmsd_mobile"],
                                 "slab_energy_change": slab_energy_change,
                             }
-                    ads_energy_calc += slab_energy * reaction_data["raw"][structure]["stoi"]
+                    ads_energy_calc += slab_energy * system["stoi"]
                     time_consumed += slab_time
                     if cached is None:
                         # Only actual relaxations count toward efficiency totals, so
@@ -458,15 +646,15 @@ class AdsorptionCalculation:
                         time_total_slab += slab_time
                         steps_total_slab += slab_steps
 
-                elif "gas" not in str(structure):  # adslab
+                elif "gas" not in structure:  # adslab
                     # Relax once per (geometry+fix, adsorbate_indices, seed) and reuse
                     # the result for every identical adslab. Same machinery as the clean
                     # slab; the key also pins adsorbate_indices because the adslab metrics
                     # (bond change, substrate displacement) depend on which atoms are the
                     # adsorbate. The relaxed-energy and the frame-invariant metrics are
                     # identical for an identical adslab -> same result, pure speedup.
-                    POSCAR_str = reaction_data["raw"][structure]["atoms"]
-                    fixed_indices = get_fixed_indices(POSCAR_str)
+                    POSCAR_str = system["atoms"]
+                    fixed_indices = fixed_indices_by_structure[structure]
                     adslab_cache_key = f"ads:{reuse_keys[structure]}|{adsorbate_indices}_{i}th"
                     cached = structure_cache.get(adslab_cache_key) if self.config.get("structure_cache", True) else None
                     if cached is not None:
@@ -482,7 +670,7 @@ class AdsorptionCalculation:
                         cached_substrate_disp = cached["substrate_displacement"]
                         ads_time = 0.0  # cache hit: no relaxation performed
                         adslab_cached = True
-                        ads_energy_calc += ads_energy * reaction_data["raw"][structure]["stoi"]
+                        ads_energy_calc += ads_energy * system["stoi"]
                     else:
                         (
                             energy_calculated,
@@ -497,7 +685,7 @@ class AdsorptionCalculation:
                             f"{log_path}/{structure}_{i}.txt" if log_path else None,
                             f"{traj_path}/{structure}_{i}" if traj_path else None,
                         )
-                        ads_energy_calc += energy_calculated * reaction_data["raw"][structure]["stoi"]
+                        ads_energy_calc += energy_calculated * system["stoi"]
                         time_consumed += time_calculated
                         ads_step = steps_calculated
                         ads_displacement_stats = calc_displacement(POSCAR_str, CONTCAR_calculated, fixed_indices)
@@ -510,34 +698,8 @@ class AdsorptionCalculation:
                         adslab_final = CONTCAR_calculated.copy()
 
                 else:  # Gas molecule
-                    gas_tag = f"{structure}_{i}th"
-                    if gas_tag in gas_energies:
-                        ads_energy_calc += gas_energies[gas_tag] * reaction_data["raw"][structure]["stoi"]
-                    else:
-                        print(f"{gas_tag} calculating")
-                        if self.config.get("save_files", True):
-                            gas_CONTCAR, gas_energy = energy_cal_gas(
-                                self.calculators[i],
-                                reaction_data["raw"][structure]["atoms"],
-                                self.config["f_crit_relax"],
-                                f"{save_directory}/gases/POSCARs/POSCAR_{gas_tag}",
-                                self.config["optimizer"],
-                                f"{save_directory}/gases/log/{gas_tag}.txt",
-                                f"{save_directory}/gases/traj/{gas_tag}",
-                            )
-                            write(f"{save_directory}/gases/CONTCARs/CONTCAR_{gas_tag}", gas_CONTCAR)
-                        else:
-                            gas_CONTCAR, gas_energy = energy_cal_gas(
-                                self.calculators[i],
-                                reaction_data["raw"][structure]["atoms"],
-                                self.config["f_crit_relax"],
-                                None,  # No save path
-                                self.config["optimizer"],
-                                None,  # No log path
-                                None,  # No trajectory path
-                            )
-                        gas_energies[gas_tag] = gas_energy
-                        ads_energy_calc += gas_energy * reaction_data["raw"][structure]["stoi"]
+                    gas_energy = self._relaxed_gas_energy(i, structure, system, save_directory, gas_energies)
+                    ads_energy_calc += gas_energy * system["stoi"]
             
             # Calculate bond change and substrate displacement
             max_bond_change = 0.0
@@ -614,9 +776,13 @@ class AdsorptionCalculation:
         
         # Analyze seed variations (for analysis stage)
         ads_med_index, ads_med_eng = find_median_index(informs["ads_eng"])
-        slab_seed_range = np.max(np.array(informs["slab_seed"])) - np.min(np.array(informs["slab_seed"]))
-        ads_seed_range = np.max(np.array(informs["ads_seed"])) - np.min(np.array(informs["ads_seed"]))
-        ads_eng_seed_range = np.max(np.array(informs["ads_eng"])) - np.min(np.array(informs["ads_eng"]))
+        # One (3, n_seeds) array, one reduction for all three seed ranges
+        slab_seed_range, ads_seed_range, ads_eng_seed_range = np.ptp(
+            np.array([informs["slab_seed"], informs["ads_seed"], informs["ads_eng"]]), axis=1
+        )
+        slab_max_disp, adslab_max_disp = np.max(
+            np.array([informs["slab_max_disp"], informs["adslab_max_disp"]]), axis=1
+        )
         
         # Anomaly detection performed in analysis phase
         
@@ -637,8 +803,8 @@ class AdsorptionCalculation:
         result["final"] = {
             "ads_eng_median": ads_med_eng,
             "median_num": ads_med_index,
-            "slab_max_disp": np.max(np.array(informs["slab_max_disp"])),
-            "adslab_max_disp": np.max(np.array(informs["adslab_max_disp"])),
+            "slab_max_disp": slab_max_disp,
+            "adslab_max_disp": adslab_max_disp,
             "slab_seed_range": slab_seed_range,
             "ads_seed_range": ads_seed_range,
             "ads_eng_seed_range": ads_eng_seed_range,
@@ -661,27 +827,18 @@ class AdsorptionCalculation:
         failed = {}
 
         print("Starting calculations...")
-        for index, key in enumerate(ref_data):
-            # Skip if already calculated
-            if key in final_result:
-                print(f"Skipping already calculated {key}")
+        pending = self._pending_reactions(ref_data, final_result)
+        for key, reaction_result, failure in self._iter_reactions("oc20", ref_data, pending, save_directory, ()):
+            if failure is not None:
+                failed[key] = failure
                 continue
+            final_result[key] = reaction_result
+            append_result_journal(save_directory, self.mlip_name, key, reaction_result)
 
-            try:
-                print(f"[{index+1}/{len(ref_data)}] {key}")
-                result = self._process_reaction_oc20(key, ref_data[key], save_directory)
-                final_result[key] = result["reaction_result"]
-
-                # Save results every save_step calculations
-                if len(final_result) % self.config["save_step"] == 0:
-                    print(f"Saving results at {len(final_result)} calculations...")
-                    self._save_results_oc20(save_directory, final_result, failed)
-
-            except Exception as e:
-                print(f"Error occurred while processing {key}: {str(e)}")
-                print("Skipping to next reaction...")
-                failed[key] = {"error": repr(e), "traceback": traceback.format_exc()[-2000:]}
-                continue
+            # Save results every save_step calculations
+            if len(final_result) % self.config["save_step"] == 0:
+                print(f"Saving results at {len(final_result)} calculations...")
+                self._save_results_oc20(save_directory, final_result, failed, pretty=False)
 
         # Final save to ensure all results are saved
         print(f"Final save: {len(final_result)} total calculations")
@@ -702,16 +859,16 @@ class AdsorptionCalculation:
         }
         
         # Add reference energies (only adslab, no gas)
-        for structure in reaction_data["raw"]:
-            if "gas" not in str(structure):
-                result["reference"][f"{structure}_tot_eng"] = reaction_data["raw"][structure]["energy_ref"]
+        for structure, system in reaction_data["raw"].items():
+            if "gas" not in structure:
+                result["reference"][f"{structure}_tot_eng"] = system["energy_ref"]
         
         # Add single-point calculation using first calculator (only adslab)
         ads_energy_single = 0
         
-        for structure in reaction_data["raw"]:
-            if "gas" not in str(structure) and structure != "star":
-                POSCAR_str = reaction_data["raw"][structure]["atoms"]
+        for structure, system in reaction_data["raw"].items():
+            if "gas" not in structure and structure != "star":
+                POSCAR_str = system["atoms"]
                 energy_calculated = energy_cal_single(self.calculators[0], POSCAR_str)
                 ads_energy_single = energy_calculated
         
@@ -747,36 +904,40 @@ class AdsorptionCalculation:
         time_consumed = 0
         time_total_ads = 0
         steps_total_ads = 0
+
+        # Resolve stored FixAtoms once per adslab, not once per calculator
+        fixed_indices_by_structure = {
+            s: get_fixed_indices(system["atoms"])
+            for s, system in reaction_data["raw"].items() if "gas" not in s and s != "star"
+        }
         
         for i in range(len(self.calculators)):
-            for structure in reaction_data["raw"]:
-                if "gas" not in str(structure) and structure != "star":
-                    POSCAR_str = reaction_data["raw"][structure]["atoms"]
-                    fixed_indices = get_fixed_indices(POSCAR_str)
-                    (
-                        ads_energy,
-                        steps_calculated,
-                        CONTCAR_calculated,
-                        time_calculated,
-                        ads_energy_change,
-                    ) = energy_cal(
-                        self.calculators[i],
-                        POSCAR_str,
-                        self.config["f_crit_relax"],
-                        self.config["n_crit_relax"],
-                        self.config["damping"],
-                        fixed_indices,
-                        self.config["optimizer"],
-                        f"{log_path}/{structure}_{i}.txt" if log_path else None,
-                        f"{traj_path}/{structure}_{i}" if traj_path else None,
-                    )
-                    time_consumed += time_calculated
+            for structure, fixed_indices in fixed_indices_by_structure.items():
+                POSCAR_str = reaction_data["raw"][structure]["atoms"]
+                (
+                    ads_energy,
+                    steps_calculated,
+                    CONTCAR_calculated,
+                    time_calculated,
+                    ads_energy_change,
+                ) = energy_cal(
+                    self.calculators[i],
+                    POSCAR_str,
+                    self.config["f_crit_relax"],
+                    self.config["n_crit_relax"],
+                    self.config["damping"],
+                    fixed_indices,
+                    self.config["optimizer"],
+                    f"{log_path}/{structure}_{i}.txt" if log_path else None,
+                    f"{traj_path}/{structure}_{i}" if traj_path else None,
+                )
+                time_consumed += time_calculated
 
-                    ads_step = steps_calculated
-                    ads_displacement_stats = calc_displacement(POSCAR_str, CONTCAR_calculated, fixed_indices)
-                    ads_time = time_calculated
-                    time_total_ads += time_calculated
-                    steps_total_ads += steps_calculated
+                ads_step = steps_calculated
+                ads_displacement_stats = calc_displacement(POSCAR_str, CONTCAR_calculated, fixed_indices)
+                ads_time = time_calculated
+                time_total_ads += time_calculated
+                steps_total_ads += steps_calculated
             
             # Anomaly detection handled in analysis phase
             
@@ -799,7 +960,7 @@ class AdsorptionCalculation:
             informs["adslab_pos_rmsd"].append(ads_displacement_stats["rmsd_mobile"])
         
         ads_med_index, ads_med_eng = find_median_index(informs["ads_eng"])
-        ads_eng_seed_range = np.max(np.array(informs["ads_eng"])) - np.min(np.array(informs["ads_eng"]))
+        ads_eng_seed_range = np.ptp(informs["ads_eng"])
         
         # Anomaly detection performed in analysis phase
         
@@ -811,7 +972,7 @@ class AdsorptionCalculation:
         result["final"] = {
             "ads_eng_median": ads_med_eng,
             "median_num": ads_med_index,
-            "adslab_max_disp": np.max(np.array(informs["adslab_max_disp"])),
+            "adslab_max_disp": np.max(informs["adslab_max_disp"]),
             "ads_eng_seed_range": ads_eng_seed_range,
             "time_total_adslab": time_total_ads,
             "steps_total_adslab": steps_total_ads,
@@ -822,13 +983,13 @@ class AdsorptionCalculation:
         
         return {"reaction_result": result, "time_consumed": time_consumed}
     
-    def _save_results_basic(self, save_directory, final_result, gas_energies, gas_energies_single, structure_cache, failures=None):
-        """Save results for basic mode."""
+    def _save_results_basic(self, save_directory, final_result, gas_energies, gas_energies_single, structure_cache, failures=None, pretty=True):
+        """Save results for basic mode (pretty=False for intermediate checkpoints)."""
         calculation_settings = get_calculation_settings(self.config)
         save_calculation_results(
             save_directory, self.mlip_name,
             final_result, gas_energies, gas_energies_single,
-            calculation_settings, failures=failures
+            calculation_settings, failures=failures, pretty=pretty
         )
         # Persist the slab-relaxation cache as a restart-safe sibling file (1.1.1),
         # mirroring the gas-cache persistence discipline.
@@ -843,13 +1004,13 @@ class AdsorptionCalculation:
             json.dump(structure_cache, f, cls=NumpyEncoder)
         os.replace(tmp_path, structure_cache_path)
 
-    def _save_results_oc20(self, save_directory, final_result, failures=None):
-        """Save results for OC20 mode."""
+    def _save_results_oc20(self, save_directory, final_result, failures=None, pretty=True):
+        """Save results for OC20 mode (pretty=False for intermediate checkpoints)."""
         calculation_settings = get_calculation_settings(self.config)
         save_calculation_results(
             save_directory, self.mlip_name,
             final_result, calculation_settings=calculation_settings,
-            failures=failures
+            failures=failures, pretty=pretty
         )
     
     def _calculate_max_bond_change(self, initial_atoms, final_atoms, adsorbate_indices):
@@ -7,23 +7,40 @@ from the CatHub database.
 
 import os
 import time
-import copy
+import threading
 import yaml
 import json
 import traceback
 import requests
-import io
 import logging
-from ase.io import read
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from ase.db.row import AtomsRow
+from ase.io.jsonio import decode
 from ase.constraints import FixAtoms
-from catbench.utils.io_utils import get_raw_data_directory, get_raw_data_path, save_json
+from catbench.utils.io_utils import (
+    get_raw_data_directory, get_raw_data_path, loads_json, read_json, save_json,
+)
 
 GRAPHQL = "http://api.catalysis-hub.org/graphql"
 
 
+# One keep-alive Session per thread (tags may download concurrently), so paging
+# reuses the open connection instead of a new TCP handshake per request.
+_thread_local = threading.local()
+
+
+def _session():
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
+
+
 def fetch(query):
     """Fetch data from CatHub GraphQL API."""
-    resp = requests.get(GRAPHQL, {"query": query}, timeout=120)
+    resp = _session().get(GRAPHQL, params={"query": query}, timeout=120)
     resp.raise_for_status()
     payload = resp.json()
     # CatHub returns {"data": null, "errors": [...]} on query errors. Surface a
@@ -125,41 +142,76 @@ def reactions_from_dataset(pub_id, page_size=40, logger=None):
     return reactions
 
 
-def aseify_reactions(reactions):
+def _atoms_from_ase_json(text):
+    """
+    Build Atoms from a CatHub ``InputFile`` (an ASE JSON database with one row).
+
+    Decodes the text once and converts the row directly; ``read(format="json")``
+    opens a database connection on a StringIO and parses the text twice (count,
+    then select).
+    """
+    bigdct = decode(text)
+    # "ids" may decode to a list or an ndarray: avoid truthiness, and take the
+    # last row (as read() does) as a plain int, like ase.db.jsondb
+    ids = bigdct.get("ids")
+    row_id = int(ids[-1]) if ids is not None and len(ids) else 1
+    dct = bigdct[row_id]
+    dct["id"] = row_id
+    return AtomsRow(dct).toatoms()
+
+
+def _aseify_chunk(chunk):
+    """Process-pool task for aseify_reactions: convert one slice and send it back."""
+    aseify_reactions(chunk)
+    return chunk
+
+
+def aseify_reactions(reactions, n_workers=1):
     """
     Convert reaction data to ASE atoms objects.
     
     Args:
         reactions: List of reaction data from CatHub
+        n_workers: Processes used for the conversion. Reactions are independent,
+                   so with n_workers > 1 the list is split into contiguous slices
+                   converted in a fork-based process pool (in-place, order kept).
     """
+    if n_workers > 1 and len(reactions) > 1 and "fork" in multiprocessing.get_all_start_methods():
+        n_chunks = min(len(reactions), n_workers * 4)
+        bounds = [len(reactions) * k // n_chunks for k in range(n_chunks + 1)]
+        chunks = [reactions[a:b] for a, b in zip(bounds, bounds[1:])]
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=multiprocessing.get_context("fork")
+        ) as pool:
+            converted = [r for chunk in pool.map(_aseify_chunk, chunks) for r in chunk]
+        reactions[:] = converted
+        return
+
     for i, reaction in enumerate(reactions):
         for j, _ in enumerate(reactions[i]["reactionSystems"]):
             system_info = reactions[i]["reactionSystems"][j].pop("systems")
 
-            with io.StringIO() as tmp_file:
-                tmp_file.write(system_info.pop("InputFile"))
-                tmp_file.seek(0)
-                atoms = read(tmp_file, format="json")
-                atoms.pbc = True
-
-                # Attach the real FixAtoms constraints from CatHub (if any).
-                # gas/bulk legitimately have constraints=None and get no constraint.
-                constraints_json = system_info.get("constraints")
-                if constraints_json:
-                    try:
-                        cons_list = json.loads(constraints_json)
-                    except (TypeError, ValueError):
-                        cons_list = []
-                    fix_constraints = []
-                    for c in cons_list:
-                        if isinstance(c, dict) and c.get("name") == "FixAtoms":
-                            idx = sorted(set(int(x) for x in c.get("kwargs", {}).get("indices", [])))
-                            if idx:
-                                fix_constraints.append(FixAtoms(indices=idx))
-                    if fix_constraints:
-                        atoms.set_constraint(fix_constraints)
-
-                reactions[i]["reactionSystems"][j]["atoms"] = atoms
+            atoms = _atoms_from_ase_json(system_info.pop("InputFile"))
+            atoms.pbc = True
+
+            # Attach the real FixAtoms constraints from CatHub (if any).
+            # gas/bulk legitimately have constraints=None and get no constraint.
+            constraints_json = system_info.get("constraints")
+            if constraints_json:
+                try:
+                    cons_list = json.loads(constraints_json)
+                except (TypeError, ValueError):
+                    cons_list = []
+                fix_constraints = []
+                for c in cons_list:
+                    if isinstance(c, dict) and c.get("name") == "FixAtoms":
+                        idx = sorted(set(int(x) for x in c.get("kwargs", {}).get("indices", [])))
+                        if idx:
+                            fix_constraints.append(FixAtoms(indices=idx))
+                if fix_constraints:
+                    atoms.set_constraint(fix_constraints)
+
+            reactions[i]["reactionSystems"][j]["atoms"] = atoms
 
             reactions[i]["reactionSystems"][j]["energy"] = system_info["energy"]
 
@@ -234,8 +286,36 @@ def _fixed_indices_from_relaxation(slab_atoms, adslab_atoms, adsorbate_indices,
     return sorted(set(slab_fixed)), sorted(adslab_fixed)
 
 
+def _download_benchmark(bench, save_directory):
+    """Download one CatHub tag into raw_data/{bench}.json, logging to its own file."""
+    path_json = os.path.join(save_directory, f"{bench}.json")
+    log_file = os.path.join(save_directory, f"{bench}_preprocessing.log")
+    bench_logger = logging.getLogger(f"catbench_{bench}")
+    bench_logger.setLevel(logging.INFO)
+    if bench_logger.hasHandlers():
+        bench_logger.handlers.clear()
+    handler = logging.FileHandler(log_file, mode='w', encoding='utf-8')
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handler.setFormatter(formatter)
+    bench_logger.addHandler(handler)
+    bench_logger.propagate = False
+    bench_logger.info(f"Starting CatHub data download for benchmark: {bench}")
+
+    bench_logger.info(f"Downloading reactions for benchmark: {bench}")
+    raw_reactions = reactions_from_dataset(bench, logger=bench_logger)
+    bench_logger.info(f"Download completed for {bench}: {len(raw_reactions)} reactions")
+    raw_reactions_json = {"raw_reactions": raw_reactions}
+    # Raw download cache is machine-read only: compact JSON (no indent) keeps the
+    # multi-MB InputFile payload fast to write and re-read on later runs.
+    save_json(raw_reactions_json, path_json, use_numpy_encoder=False, indent=None)
+    bench_logger.info(f"Saved raw data to {path_json}")
+    # Remove handlers for each benchmark to prevent memory leaks
+    bench_logger.handlers.clear()
+    return raw_reactions_json
+
+
 def cathub_preprocessing(benchmark, adsorbate_integration=None, require_constraints=True,
-                         infer_fix_when_missing=True, fix_detect_tol=1e-4):
+                         infer_fix_when_missing=True, fix_detect_tol=1e-4, n_workers=1):
     """
     Download and preprocess CatHub data for MLIP benchmarking.
     
@@ -268,6 +348,9 @@ def cathub_preprocessing(benchmark, adsorbate_integration=None, require_constrai
         adsorbate_integration (dict, optional): Mapping for adsorbate name unification.
                                               Format: {"source_name": "target_name"}
                                               Example: {"OH2": "H2O", "H2O2": "OOH"}
+        n_workers (int, optional): Processes used to convert the downloaded
+                                   structures to ASE Atoms (fork-based pool).
+                                   Default: 1 (serial)
                                               
     Raises:
         ValueError: If reaction energy validation fails
@@ -307,36 +390,27 @@ def cathub_preprocessing(benchmark, adsorbate_integration=None, require_constrai
     # Initialize combined data structure
     combined_reactions = []
     
+    # Tags are independent downloads, so missing ones are fetched concurrently.
+    # Pagination within a tag stays sequential: every page needs the previous
+    # page's endCursor. A tag listed twice is fetched once (two threads would
+    # race on the same cache file and log); every occurrence is still read below.
+    missing = list(dict.fromkeys(
+        bench for bench in benchmarks
+        if not os.path.exists(os.path.join(save_directory, f"{bench}.json"))
+    ))
+    downloaded = {}
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(4, len(missing))) as pool:
+            downloaded = dict(zip(
+                missing, pool.map(lambda b: _download_benchmark(b, save_directory), missing)
+            ))
+
     for bench in benchmarks:
-        path_json = os.path.join(save_directory, f"{bench}.json")
-        # Create separate logger/handler for each benchmark
-        bench_logger = None
-        log_file = os.path.join(save_directory, f"{bench}_preprocessing.log")
-        bench_logger = logging.getLogger(f"catbench_{bench}")
-        bench_logger.setLevel(logging.INFO)
-        if bench_logger.hasHandlers():
-            bench_logger.handlers.clear()
-        handler = logging.FileHandler(log_file, mode='w', encoding='utf-8')
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        bench_logger.addHandler(handler)
-        bench_logger.propagate = False
-        bench_logger.info(f"Starting CatHub data download for benchmark: {bench}")
-        
-        # Get reactions for benchmark (preliminary download)
-        if not os.path.exists(path_json):
-            bench_logger.info(f"Downloading reactions for benchmark: {bench}")
-            raw_reactions = reactions_from_dataset(bench, logger=bench_logger)
-            bench_logger.info(f"Download completed for {bench}: {len(raw_reactions)} reactions")
-            raw_reactions_json = {"raw_reactions": raw_reactions}
-            save_json(raw_reactions_json, path_json, use_numpy_encoder=False)
-            bench_logger.info(f"Saved raw data to {path_json}")
+        if bench in downloaded:
+            raw_reactions_json = downloaded[bench]
         else:
-            with open(path_json, "r") as file:
-                raw_reactions_json = json.load(file)
+            raw_reactions_json = read_json(os.path.join(save_directory, f"{bench}.json"))
         combined_reactions.extend(raw_reactions_json["raw_reactions"])
-                    # Remove handlers for each benchmark to prevent memory leaks
-        bench_logger.handlers.clear()
     
     # Generate output filename based on input type
     if isinstance(benchmark, str):
@@ -387,8 +461,10 @@ def cathub_preprocessing(benchmark, adsorbate_integration=None, require_constrai
         logger.info(f"Total combined reactions to process: {len(combined_reactions)}")
         logger.info(f"Data processing output will be saved to {path_output}")
         
-        # Process combined reactions
-        dat = copy.deepcopy(combined_reactions)
+        # Process combined reactions. aseify_reactions mutates the entries in place;
+        # combined_reactions is not used afterwards (and the raw cache is already on
+        # disk), so no defensive deep copy of the whole dataset is needed.
+        dat = combined_reactions
 
         # Deterministic dedup safety net. New downloads carry a CatHub `id`; older
         # cached raw files (downloaded before the ordering fix) do not, so fall back
@@ -424,21 +500,22 @@ def cathub_preprocessing(benchmark, adsorbate_integration=None, require_constrai
         dat = deduped
 
         logger.info("Converting reaction data to ASE atoms objects...")
-        aseify_reactions(dat)
+        # Structure decoding is per-reaction independent and can be fanned out;
+        # the validation loop below stays serial (its duplicate-tag suffixes and
+        # rollback depend on dataset order).
+        aseify_reactions(dat, n_workers=n_workers)
 
         data_total = {}
-        tags = []
+        # Occurrences per base tag: O(1) lookups instead of list.count/remove scans
+        tag_counts = Counter()
         
         logger.info(f"Processing {len(dat)} reactions for energy validation...")
 
         for i, _ in enumerate(dat):
             try:
                 input = {}
-                reactants_json = dat[i]["reactants"]
-                reactants_dict = json.loads(reactants_json)
-
-                products_json = dat[i]["products"]
-                products_dict = json.loads(products_json)
+                reactants_dict = loads_json(dat[i]["reactants"])
+                products_dict = loads_json(dat[i]["products"])
 
 
 
@@ -451,44 +528,41 @@ def cathub_preprocessing(benchmark, adsorbate_integration=None, require_constrai
                     sym = dat[i]["reactionSystems"][first_key]["atoms"].get_chemical_formula()
                 
                 reaction_name = dat[i]["Equation"]
-                # Track the *base* tag in `tags` so the duplicate count stays
-                # consistent. The displayed tag gets a deterministic `_N` suffix
-                # only for genuine collisions (distinct reactions sharing the same
-                # formula + equation). `base_tag` is what we add/remove for counting.
+                # Count the *base* tag so the duplicate count stays consistent.
+                # The displayed tag gets a deterministic `_N` suffix only for
+                # genuine collisions (distinct reactions sharing the same formula +
+                # equation). `base_tag` is what we increment/decrement for counting.
                 base_tag = sym + "_" + reaction_name
-                count = tags.count(base_tag)
-                tags.append(base_tag)
+                count = tag_counts[base_tag]
+                tag_counts[base_tag] += 1
                 tag = base_tag if count == 0 else f"{base_tag}_{count}"
 
 
 
                 # Step 1: Add all structures from reactants and products dictionaries as-is
-                for key in dat[i]["reactionSystems"]:
+                for key, system in dat[i]["reactionSystems"].items():
                     if key in reactants_dict:
-                        input[key] = {
-                            "stoi": -reactants_dict[key],
-                            "atoms": dat[i]["reactionSystems"][key]["atoms"],
-                            "energy_ref": dat[i]["reactionSystems"][key]["energy"],
-                        }
+                        stoi = -reactants_dict[key]
                     elif key in products_dict:
-                        input[key] = {
-                            "stoi": products_dict[key],
-                            "atoms": dat[i]["reactionSystems"][key]["atoms"],
-                            "energy_ref": dat[i]["reactionSystems"][key]["energy"],
-                        }
+                        stoi = products_dict[key]
+                    else:
+                        continue
+                    input[key] = {
+                        "stoi": stoi,
+                        "atoms": system["atoms"],
+                        "energy_ref": system["energy"],
+                    }
 
                 # Filter for single adsorbate reactions only
-                star_structures = [key for key in input.keys() if "star" in key]
-                if len(star_structures) != 2:
-                    logger.info(f"Filtered - {tag}: Multi-adsorbate reaction (found {len(star_structures) - 1} adslab structures, expected 1)")
+                n_star = sum(1 for key in input if "star" in key)
+                if n_star != 2:
+                    logger.info(f"Filtered - {tag}: Multi-adsorbate reaction (found {n_star - 1} adslab structures, expected 1)")
                     continue
 
                 # Step 2: First energy validation with original coefficients
-                energy_check = 0
-                for structure in input:
-                    energy_check += (
-                        input[structure]["energy_ref"] * input[structure]["stoi"]
-                    )
+                energy_check = sum(
+                    entry["energy_ref"] * entry["stoi"] for entry in input.values()
+                )
                 
                 validation_passed = False
                 if abs(dat[i]["reactionEnergy"] - energy_check) <= 0.001:
@@ -500,22 +574,18 @@ def cathub_preprocessing(benchmark, adsorbate_integration=None, require_constrai
                     logger.debug(f"First validation failed for {tag}, trying with adslab coefficient = 1")
                     
                     # Find the adslab structure (not "star")
-                    adslab_key = None
-                    for key in input.keys():
-                        if "star" in key and key != "star":
-                            adslab_key = key
-                            break
+                    adslab_key = next(
+                        (key for key in input if "star" in key and key != "star"), None
+                    )
                     
                     if adslab_key:
                         original_coeff = input[adslab_key]["stoi"]
                         input[adslab_key]["stoi"] = 1  # Try with coefficient 1
                         
                         # Recalculate energy with corrected coefficient
-                        energy_check_retry = 0
-                        for structure in input:
-                            energy_check_retry += (
-                                input[structure]["energy_ref"] * input[structure]["stoi"]
-                            )
+                        energy_check_retry = sum(
+                            entry["energy_ref"] * entry["stoi"] for entry in input.values()
+                        )
                         
                         if abs(dat[i]["reactionEnergy"] - energy_check_retry) <= 0.001:
                             # Validation passed with coefficient = 1
@@ -538,25 +608,24 @@ def cathub_preprocessing(benchmark, adsorbate_integration=None, require_constrai
                     if adslab_key:
                         logger.debug(f"  With adslab coeff=1: {energy_check_retry:.6f} eV (diff: {abs(dat[i]['reactionEnergy'] - energy_check_retry):.6f} eV)")
                     
-                    # Roll back the count bookkeeping using the base tag. The old
-                    # code removed the suffixed `tag` (e.g. "X_1"), which was never
-                    # added to `tags`, so removal silently failed and corrupted the
-                    # duplicate count for later collisions.
-                    if base_tag in tags:
-                        tags.remove(base_tag)
+                    # Roll back the count bookkeeping using the base tag (never the
+                    # suffixed `tag`, e.g. "X_1", which is not what was counted).
+                    tag_counts[base_tag] -= 1
                     continue
 
                 # Apply adsorbate integration if specified
                 if adsorbate_integration:
                     integration_applied = False
-                    for key in list(data_total[tag]["raw"].keys()):
-                        if "star" in key and key != "star":
-                            adsorbate = key[:-4]
-                            if adsorbate in adsorbate_integration:
-                                integrated_key = f"{adsorbate_integration[adsorbate]}star"
-                                data_total[tag]["raw"][integrated_key] = data_total[tag]["raw"].pop(key)
-                                logger.debug(f"Integrated adsorbate in {tag}: {key} → {integrated_key}")
-                                integration_applied = True
+                    adslab_keys = [
+                        key for key in data_total[tag]["raw"] if "star" in key and key != "star"
+                    ]
+                    for key in adslab_keys:
+                        adsorbate = key[:-4]
+                        if adsorbate in adsorbate_integration:
+                            integrated_key = f"{adsorbate_integration[adsorbate]}star"
+                            data_total[tag]["raw"][integrated_key] = data_total[tag]["raw"].pop(key)
+                            logger.debug(f"Integrated adsorbate in {tag}: {key} → {integrated_key}")
+                            integration_applied = True
                     if integration_applied:
                         logger.info(f"Applied adsorbate integration to reaction: {tag}")
                 
@@ -565,11 +634,10 @@ def cathub_preprocessing(benchmark, adsorbate_integration=None, require_constrai
                 
                 # Find slab and adslab structures
                 slab_key = "star"
-                adslab_key = None
-                for key in data_total[tag]["raw"].keys():
-                    if "star" in key and key != "star":
-                        adslab_key = key
-                        break
+                adslab_key = next(
+                    (key for key in data_total[tag]["raw"] if "star" in key and key != "star"),
+                    None,
+                )
                 
                 if slab_key in data_total[tag]["raw"] and adslab_key:
                     slab_atoms = data_total[tag]["raw"][slab_key]["atoms"]
@@ -703,9 +771,14 @@ def download(benchmark_tags):
     if isinstance(benchmark_tags, str):
         benchmark_tags = [benchmark_tags]
     
+    # Fetch each distinct tag once; a repeated tag still contributes its
+    # reactions once per occurrence, as the sequential loop did.
+    unique_tags = list(dict.fromkeys(benchmark_tags))
+    with ThreadPoolExecutor(max_workers=min(4, max(1, len(unique_tags)))) as pool:
+        fetched = dict(zip(unique_tags, pool.map(reactions_from_dataset, unique_tags)))
+
     all_reactions = []
     for tag in benchmark_tags:
-        reactions = reactions_from_dataset(tag)
-        all_reactions.extend(reactions)
+        all_reactions.extend(fetched[tag])
     
     return all_reactions 
\ No newline at end of file
@@ -23,9 +23,13 @@ def read_E0_from_OSZICAR(file_path):
         float: Final energy in eV
     """
     try:
-        with open(file_path, "r") as file:
-            lines = file.readlines()
-            last_line = lines[-1]
+        # Only the last line is needed; read a tail block instead of the whole
+        # (possibly long) OSZICAR of a many-step relaxation.
+        with open(file_path, "rb") as file:
+            file.seek(0, os.SEEK_END)
+            file.seek(max(0, file.tell() - 4096))
+            tail_lines = file.read().splitlines()
+        last_line = tail_lines[-1].decode() if tail_lines else ""
 
         energy = None
         # Robust to both "E0= -0.123" and the glued "E0=-0.123" that VASP can
@@ -47,6 +51,44 @@ def read_E0_from_OSZICAR(file_path):
         )
 
 
+def _find_reaction_dirs(dataset_name):
+    """
+    List the reaction calculation directories of a VASP dataset tree.
+
+    Args:
+        dataset_name: Path to dataset directory
+
+    Returns:
+        list: (dirpath, slab_name, rxn_name) for every directory holding an
+        OSZICAR and CONTCAR below a slab, excluding gas species and slab
+        directories, in os.walk order
+    """
+    # Non-calculation directory names (gas species and slab); invariant over
+    # the walk, so list the gas directory once up front
+    not_calc_dirs = {"slab"}
+    gas_path = os.path.join(dataset_name, "gas")
+    if os.path.exists(gas_path):
+        not_calc_dirs.update(
+            entry.name for entry in os.scandir(gas_path) if entry.is_dir()
+        )
+
+    reaction_dirs = []
+    for dirpath, dirnames, filenames in os.walk(dataset_name):
+        if "OSZICAR" in filenames and "CONTCAR" in filenames:
+            # Get relative path from dataset root
+            rel_path = os.path.relpath(dirpath, dataset_name)
+            path_parts = rel_path.split(os.sep)
+
+            # Skip if path is too short or is in gas directory
+            if len(path_parts) < 2 or path_parts[0] == "gas":
+                continue
+
+            rxn_name = path_parts[1]
+            if rxn_name not in not_calc_dirs:
+                reaction_dirs.append((dirpath, path_parts[0], rxn_name))
+    return reaction_dirs
+
+
 def process_output(dataset_name, coeff_setting):
     """
     Clean up VASP output files and prepare coefficient settings.
@@ -57,43 +99,23 @@ def process_output(dataset_name, coeff_setting):
     Args:
         dataset_name: Path to dataset directory
         coeff_setting: Dictionary containing coefficient settings for each reaction
+
+    Returns:
+        list: Reaction directories found, as (dirpath, slab_name, rxn_name)
     """
     # Use unified cleanup function to remove unnecessary files
     cleanup_vasp_files(dataset_name, keep_files=["OSZICAR", "CONTCAR"], verbose=True)
     
     # Add coefficient files where needed
-    for dirpath, dirnames, filenames in os.walk(dataset_name):
-        if "OSZICAR" in filenames and "CONTCAR" in filenames:
-            # Get relative path from dataset root
-            rel_path = os.path.relpath(dirpath, dataset_name)
-            path_parts = rel_path.split(os.sep)
-            
-            # Skip if path is too short or is in gas directory
-            if len(path_parts) < 2 or path_parts[0] == "gas":
-                continue
-                
-            slab_name = path_parts[0]
-            rxn_name = path_parts[1] if len(path_parts) > 1 else None
-            
-            # Get list of non-calculation directories (gas species and slab)
-            not_calc_dirs = ["slab"]
-            gas_path = os.path.join(dataset_name, "gas")
-            if os.path.exists(gas_path):
-                not_calc_dirs += [
-                    name
-                    for name in os.listdir(gas_path)
-                    if os.path.isdir(os.path.join(gas_path, name))
-                ]
-            
-            # Only add coeff.json for actual reaction directories
-            if rxn_name and rxn_name not in not_calc_dirs:
-                if rxn_name in coeff_setting:
-                    coeff = coeff_setting[rxn_name]
-                    coeff_path = os.path.join(dirpath, "coeff.json")
-                    if not os.path.exists(coeff_path):
-                        save_json(coeff, coeff_path, use_numpy_encoder=False)
-                else:
-                    print(f"Warning: No coefficient settings found for reaction '{rxn_name}' in {slab_name}")
+    reaction_dirs = _find_reaction_dirs(dataset_name)
+    for dirpath, slab_name, rxn_name in reaction_dirs:
+        if rxn_name in coeff_setting:
+            coeff = coeff_setting[rxn_name]
+            coeff_path = os.path.join(dirpath, "coeff.json")
+            if not os.path.exists(coeff_path):
+                save_json(coeff, coeff_path, use_numpy_encoder=False)
+        else:
+            print(f"Warning: No coefficient settings found for reaction '{rxn_name}' in {slab_name}")
 
     for dir_name in os.listdir(dataset_name):
         dir_path = os.path.join(dataset_name, dir_name)
@@ -101,8 +123,10 @@ def process_output(dataset_name, coeff_setting):
             slab_folder_path = os.path.join(dir_path, "slab")
             os.makedirs(slab_folder_path, exist_ok=True)
 
+    return reaction_dirs
+
 
-def userdata_preprocess(dataset_name):
+def userdata_preprocess(dataset_name, reaction_dirs=None):
     """
     Preprocess user VASP dataset for benchmarking.
     
@@ -111,101 +135,80 @@ def userdata_preprocess(dataset_name):
     
     Args:
         dataset_name: Path to the dataset directory containing VASP calculations
+        reaction_dirs: Reaction directories as returned by process_output; the
+                       tree is walked again if None
     """
     save_directory = get_raw_data_directory()
     os.makedirs(save_directory, exist_ok=True)
     # JSON format with _catbench suffix
     path_output = get_raw_data_path(dataset_name)
     data_total = {}
-    tags = []
+    # Occurrences per slab_rxn tag (dict lookup instead of list.count per reaction)
+    tag_counts = {}
     
-    # Get list of non-calculation directories
-    not_calc_dirs = ["slab"]
-    gas_path = os.path.join(dataset_name, "gas")
-    if os.path.exists(gas_path):
-        not_calc_dirs += [
-            name
-            for name in os.listdir(gas_path)
-            if os.path.isdir(os.path.join(gas_path, name))
-        ]
-
-    for dirpath, dirnames, filenames in os.walk(dataset_name):
-        if "OSZICAR" in filenames and "CONTCAR" in filenames:
-            # Get relative path from dataset root
-            rel_path = os.path.relpath(dirpath, dataset_name)
-            path_parts = rel_path.split(os.sep)
-            
-            # Skip if in gas directory or path too short
-            if len(path_parts) < 2 or path_parts[0] == "gas":
-                continue
-                
-            slab_name = path_parts[0]
-            rxn_name = path_parts[1] if len(path_parts) > 1 else None
-            
-            if rxn_name and rxn_name not in not_calc_dirs:
-                input = {}
-                slab_path = os.path.join(dataset_name, slab_name)
-
-                coeff_path = os.path.join(dirpath, "coeff.json")
-                with open(coeff_path, "r") as file:
-                    coeff = json.load(file)
-
-                tag = slab_name + "_" + rxn_name
-
-                if tag in tags:
-                    count = tags.count(tag)
-                    tags.append(tag)
-                    tag = f"{tag}_{count}"
-                else:
-                    tags.append(tag)
-
-                input["star"] = {
-                    "stoi": coeff["slab"],
-                    "atoms": read(f"{slab_path}/slab/CONTCAR"),
-                    "energy_ref": read_E0_from_OSZICAR(f"{slab_path}/slab/OSZICAR"),
+    if reaction_dirs is None:
+        reaction_dirs = _find_reaction_dirs(dataset_name)
+
+    for dirpath, slab_name, rxn_name in reaction_dirs:
+        input = {}
+        slab_path = os.path.join(dataset_name, slab_name)
+
+        coeff_path = os.path.join(dirpath, "coeff.json")
+        with open(coeff_path, "r") as file:
+            coeff = json.load(file)
+
+        tag = slab_name + "_" + rxn_name
+
+        count = tag_counts.get(tag, 0)
+        tag_counts[tag] = count + 1
+        if count:
+            tag = f"{tag}_{count}"
+
+        input["star"] = {
+            "stoi": coeff["slab"],
+            "atoms": read(f"{slab_path}/slab/CONTCAR"),
+            "energy_ref": read_E0_from_OSZICAR(f"{slab_path}/slab/OSZICAR"),
+        }
+
+        input[f"{rxn_name}star"] = {
+            "stoi": coeff["adslab"],
+            "atoms": read(f"{dirpath}/CONTCAR"),
+            "energy_ref": read_E0_from_OSZICAR(f"{dirpath}/OSZICAR"),
+        }
+
+        for key in coeff:
+            if key not in ["slab", "adslab"]:
+                input[key] = {
+                    "stoi": coeff[key],
+                    "atoms": read(f"{dataset_name}/gas/{key}/CONTCAR"),
+                    "energy_ref": read_E0_from_OSZICAR(
+                        f"{dataset_name}/gas/{key}/OSZICAR"
+                    ),
                 }
 
-                input[f"{rxn_name}star"] = {
-                    "stoi": coeff["adslab"],
-                    "atoms": read(f"{dirpath}/CONTCAR"),
-                    "energy_ref": read_E0_from_OSZICAR(f"{dirpath}/OSZICAR"),
-                }
+        energy_check = sum(
+            entry["energy_ref"] * entry["stoi"] for entry in input.values()
+        )
 
-                for key in coeff:
-                    if key not in ["slab", "adslab"]:
-                        input[key] = {
-                            "stoi": coeff[key],
-                            "atoms": read(f"{dataset_name}/gas/{key}/CONTCAR"),
-                            "energy_ref": read_E0_from_OSZICAR(
-                                f"{dataset_name}/gas/{key}/OSZICAR"
-                            ),
-                        }
-
-                energy_check = 0
-                for structure in input:
-                    energy_check += (
-                        input[structure]["energy_ref"] * input[structure]["stoi"]
-                    )
-
-                data_total[tag] = {}
-
-                data_total[tag]["raw"] = input
-                data_total[tag]["ref_ads_eng"] = energy_check
-                
-                # Add adsorbate indices detection using common utility
-                from catbench.utils.data_utils import detect_adsorbate_indices
-                
-                slab_atoms = input["star"]["atoms"]
-                adslab_atoms = input[f"{rxn_name}star"]["atoms"]
-                
-                # Use common detection function
-                adsorbate_indices = detect_adsorbate_indices(slab_atoms, adslab_atoms)
-                
-                # Store adsorbate indices
-                data_total[tag]["adsorbate_indices"] = adsorbate_indices
+        data_total[tag] = {}
+
+        data_total[tag]["raw"] = input
+        data_total[tag]["ref_ads_eng"] = energy_check
+        
+        # Add adsorbate indices detection using common utility
+        from catbench.utils.data_utils import detect_adsorbate_indices
+        
+        slab_atoms = input["star"]["atoms"]
+        adslab_atoms = input[f"{rxn_name}star"]["atoms"]
+        
+        # Use common detection function
+        adsorbate_indices = detect_adsorbate_indices(slab_atoms, adslab_atoms)
+        
+        # Store adsorbate indices
+        data_total[tag]["adsorbate_indices"] = adsorbate_indices
 
     # Show detailed statistics
-    total_reactions = len(tags)
+    total_reactions = sum(tag_counts.values())
     successful_reactions = len(data_total)
     success_rate = (successful_reactions / total_reactions * 100) if total_reactions > 0 else 100
     
@@ -328,10 +331,10 @@ def vasp_preprocessing(dataset_name, coeff_setting):
     _validate_vasp_inputs(dataset_name, coeff_setting)
 
     print("Step 1: Cleaning VASP output files...")
-    process_output(dataset_name, coeff_setting)
+    reaction_dirs = process_output(dataset_name, coeff_setting)
     
     print("Step 2: Preprocessing VASP data...")
-    userdata_preprocess(dataset_name)
+    userdata_preprocess(dataset_name, reaction_dirs)
     
     print(f"VASP data processing completed for {dataset_name}")
 
@@ -16,6 +16,7 @@ CALCULATION_DEFAULTS = {
     "optimizer": "LBFGS",
     "save_step": 50,  # Save results every N calculations
     "save_files": True,  # Save trajectory, log, and gas files (False: save only result.json)
+    "n_workers": 1,  # Reactions processed in parallel (fork-based process pool; 1 = serial)
 
     # Optimization parameters
     "f_crit_relax": 0.05,
@@ -39,6 +40,7 @@ ANALYSIS_DEFAULTS = {
     "exclude_adsorbates": None,
     "benchmarking_name": lambda: os.path.basename(os.getcwd()),
     "time_unit": "ms",  # "s", "ms", or "µs"
+    "n_workers": 1,  # MLIPs analysed in parallel (fork-based process pool; 1 = serial)
     
     # Anomaly detection thresholds
     "disp_thrs": 0.5,
@@ -92,17 +94,25 @@ ANALYSIS_DEFAULTS = {
     "plot_enabled": True,
 }
 
-# Color and marker settings for multi plots
-PLOT_COLORS = [
+# Color and marker cycles for multi plots; index them modulo their length
+PLOT_COLOR_CYCLE = (
     "blue", "red", "green", "purple", "orange", "brown", "pink", "gray", 
     "olive", "cyan", "magenta", "lime", "indigo", "gold", "darkred", "teal",
     "coral", "turquoise", "salmon", "navy", "maroon", "forestgreen",
     "darkorange", "aqua", "lavender", "khaki", "crimson", "chocolate"
-] * 100
+)
 
-PLOT_MARKERS = [
+PLOT_MARKER_CYCLE = (
     "o", "^", "s", "p", "*", "h", "D", "H", "d", "<", ">", "v", "8", "P", "X"
-] * 100
+)
+
+# Historical pre-repeated lists, kept for code that indexes them directly
+PLOT_COLORS = list(PLOT_COLOR_CYCLE) * 100
+PLOT_MARKERS = list(PLOT_MARKER_CYCLE) * 100
+
+# Pillow PNG encoder settings for every saved plot. zlib level 3 instead of the
+# default 6 encodes 300-dpi plots ~30% faster for slightly larger files.
+PNG_PIL_KWARGS = {"compress_level": 3}
 
 # ============================================================================
 # RELATIVE ENERGY ANALYSIS DEFAULTS (from analysis/relative_analysis.py)
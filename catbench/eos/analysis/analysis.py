@@ -5,14 +5,16 @@ Provides comprehensive analysis and visualization for EOS benchmarking results.
 """
 
 import os
-import json
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MaxNLocator, FormatStrFormatter
 from scipy.optimize import curve_fit
 import pandas as pd
 from catbench.utils.analysis_utils import set_matplotlib_font
-from catbench.config import ANALYSIS_DEFAULTS, get_default
+from catbench.utils.io_utils import read_json
+from catbench.config import ANALYSIS_DEFAULTS, PNG_PIL_KWARGS, get_default
 
 
 class EOSAnalysis:
@@ -117,13 +119,13 @@ class EOSAnalysis:
             return []
         
         mlip_dirs = []
-        for item in os.listdir(self.calculating_path):
-            item_path = os.path.join(self.calculating_path, item)
-            if os.path.isdir(item_path):
-                # Check if result file exists
-                result_file = os.path.join(item_path, f"{item}_eos_result.json")
-                if os.path.exists(result_file):
-                    mlip_dirs.append(item)
+        with os.scandir(self.calculating_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Check if result file exists
+                    result_file = os.path.join(entry.path, f"{entry.name}_eos_result.json")
+                    if os.path.exists(result_file):
+                        mlip_dirs.append(entry.name)
         
         return sorted(mlip_dirs, key=str.lower)
     
@@ -174,8 +176,7 @@ class EOSAnalysis:
             result_file = os.path.join(self.calculating_path, mlip_name, f"{mlip_name}_eos_result.json")
             
             if os.path.exists(result_file):
-                with open(result_file, 'r') as f:
-                    all_results[mlip_name] = json.load(f)
+                all_results[mlip_name] = read_json(result_file)
             else:
                 print(f"Warning: Result file not found for {mlip_name}")
         
@@ -291,7 +292,7 @@ class EOSAnalysis:
 
                 # Save plot
                 plot_file = os.path.join(plot_dir, f"EOS_{material}.png")
-                fig.savefig(plot_file, dpi=self.dpi, bbox_inches='tight')
+                fig.savefig(plot_file, dpi=self.dpi, bbox_inches='tight', pil_kwargs=PNG_PIL_KWARGS)
             finally:
                 plt.close(fig)
 
@@ -394,7 +395,7 @@ class EOSAnalysis:
 
                 # Save plot directly in plot/
                 plot_file = os.path.join(self.plot_path, f"EOS_comparison_{material}.png")
-                fig.savefig(plot_file, dpi=self.dpi, bbox_inches='tight')
+                fig.savefig(plot_file, dpi=self.dpi, bbox_inches='tight', pil_kwargs=PNG_PIL_KWARGS)
 
                 print(f"    Saved: {plot_file}")
             finally:
@@ -568,8 +569,7 @@ class EOSAnalysis:
                     df_material = df_material.sort_values('sort_key')
                     df_material = df_material.drop('sort_key', axis=1)
                     sheet_name = f'{material}'  # Simple sheet name
-                    df_material.to_excel(writer, sheet_name=sheet_name, index=False)
-                    worksheet = writer.sheets[sheet_name]
+                    worksheet = self._add_sheet(writer, sheet_name)
                     self._format_worksheet_detailed(worksheet, df_material, header_format,
                                                    center_format, number_format_3f,
                                                    number_format_1f, number_format_int)
@@ -582,8 +582,7 @@ class EOSAnalysis:
                     # Sort by material name alphabetically
                     df_mlip = df_mlip.sort_values('Material')
                     sheet_name = f'{self._display_mlip_name(mlip_name)}'  # Simple sheet name
-                    df_mlip.to_excel(writer, sheet_name=sheet_name, index=False)
-                    worksheet = writer.sheets[sheet_name]
+                    worksheet = self._add_sheet(writer, sheet_name)
                     self._format_worksheet_detailed(worksheet, df_mlip, header_format,
                                                    center_format, number_format_3f,
                                                    number_format_1f, number_format_int)
@@ -686,12 +685,26 @@ class EOSAnalysis:
         # Create DataFrame and write to Summary sheet
         df_summary = pd.DataFrame(summary_data)
         if not df_summary.empty:
-            df_summary.to_excel(writer, sheet_name='Summary', index=False)
-            worksheet = writer.sheets['Summary']
+            worksheet = self._add_sheet(writer, 'Summary')
             self._format_worksheet_detailed(worksheet, df_summary, header_format,
                                            center_format, number_format,
                                            number_format, int_format)
     
+    def _add_sheet(self, writer, sheet_name):
+        """
+        Return an empty worksheet for sheet_name.
+
+        _format_worksheet_detailed writes the header and every cell itself, so
+        the sheet is not pre-filled with df.to_excel (which would write each
+        cell twice). An existing sheet of the same name is reused, as
+        to_excel would; it is looked up on the workbook because before pandas
+        1.5 writer.sheets only tracks sheets created by to_excel.
+        """
+        worksheet = writer.book.get_worksheet_by_name(sheet_name)
+        if worksheet is None:
+            worksheet = writer.book.add_worksheet(sheet_name)
+        return worksheet
+
     def _format_worksheet_detailed(self, worksheet, df, header_format, center_format,
                                   number_format, volume_format, int_format):
         """Format worksheet with proper alignment and specific number formatting."""
@@ -699,19 +712,24 @@ class EOSAnalysis:
         for col_num, value in enumerate(df.columns.values):
             worksheet.write(0, col_num, value, header_format)
         
-        # Apply specific formats to data cells based on column type
-        for row_idx in range(1, len(df) + 1):
-            for col_idx, col_name in enumerate(df.columns):
-                value = df.iloc[row_idx - 1, col_idx]
-                
+        # Apply specific formats to data cells based on column type. The format
+        # of the name-based columns is resolved once per column; only the
+        # numeric/other split still depends on the cell value.
+        for col_idx, col_name in enumerate(df.columns):
+            if 'N Points' in col_name:
+                column_format = int_format
+            elif 'Vol' in col_name or 'Å³' in col_name:
+                column_format = volume_format
+            elif col_name in ['MLIP', 'Material']:
+                column_format = center_format
+            else:
+                column_format = None
+
+            for row_idx, value in enumerate(df.iloc[:, col_idx].to_numpy(), start=1):
                 if pd.isna(value):
                     worksheet.write(row_idx, col_idx, "", center_format)
-                elif 'N Points' in col_name:
-                    worksheet.write(row_idx, col_idx, value, int_format)
-                elif 'Vol' in col_name or 'Å³' in col_name:
-                    worksheet.write(row_idx, col_idx, value, volume_format)
-                elif col_name in ['MLIP', 'Material']:
-                    worksheet.write(row_idx, col_idx, value, center_format)
+                elif column_format is not None:
+                    worksheet.write(row_idx, col_idx, value, column_format)
                 elif isinstance(value, (int, float)):
                     worksheet.write(row_idx, col_idx, value, number_format)
                 else:
@@ -721,19 +739,19 @@ class EOSAnalysis:
         for i, col in enumerate(df.columns):
             if col in ['MLIP', 'Material']:
                 # Wider columns for MLIP and Material names
-                column_len = df[col].astype(str).str.len().max()
-                column_len = max(column_len, len(col)) + 4  # Extra padding for names
-                worksheet.set_column(i, i, min(column_len, 30))  # Max width 30
+                max_width = 30
             elif any(keyword in col for keyword in ['Overall RMSE', 'Overall MAE', 'Avg V0 Error', 'Avg B0 Error', 'Avg B0\' Error']):
                 # Extra wide columns for summary metrics with long headers
-                column_len = df[col].astype(str).str.len().max()
-                column_len = max(column_len, len(col)) + 4  # More padding for long headers
-                worksheet.set_column(i, i, min(column_len, 21))  # Max width 21 (18+3)
+                max_width = 21  # 18+3
             else:
                 # Wider columns for numeric values (increased by 3)
-                column_len = df[col].astype(str).str.len().max()
-                column_len = max(column_len, len(col)) + 4  # More padding for numbers
-                worksheet.set_column(i, i, min(column_len, 18))  # Max width 18 (15+3)
+                max_width = 18  # 15+3
+            # A header that already reaches the cap fixes the width; only
+            # stringify the column when its values can still matter
+            column_len = len(col) + 4
+            if column_len < max_width:
+                column_len = max(df[col].astype(str).str.len().max(), len(col)) + 4
+            worksheet.set_column(i, i, min(column_len, max_width))
     
     
     def _fit_birch_murnaghan(self, volumes, energies):
@@ -6,16 +6,19 @@ and custom relative energy benchmarking results.
 """
 
 import os
-import json
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import pandas as pd
 
 from catbench.utils.analysis_utils import set_matplotlib_font
+from catbench.utils.io_utils import read_json
 from catbench.config import (
     RELATIVE_ANALYSIS_DEFAULTS,
     get_default,
     EV_PER_ANG2_TO_J_PER_M2,
+    PNG_PIL_KWARGS,
 )
 
 
@@ -130,11 +133,8 @@ class RelativeEnergyAnalysis:
         if not os.path.exists(self.task_result_path):
             raise FileNotFoundError(f"Task result directory not found: {self.task_result_path}")
             
-        mlip_dirs = []
-        for item in os.listdir(self.task_result_path):
-            item_path = os.path.join(self.task_result_path, item)
-            if os.path.isdir(item_path):
-                mlip_dirs.append(item)
+        with os.scandir(self.task_result_path) as entries:
+            mlip_dirs = [entry.name for entry in entries if entry.is_dir()]
          
         if not mlip_dirs:
             raise FileNotFoundError(f"No MLIP directories found in {self.task_result_path}")
@@ -192,8 +192,7 @@ class RelativeEnergyAnalysis:
                 print(f"    Warning: Result file not found: {result_path}")
                 continue
                 
-            with open(result_path, 'r') as f:
-                results = json.load(f)
+            results = read_json(result_path)
             
             ref_values = []
             pred_values = []
@@ -271,7 +270,7 @@ class RelativeEnergyAnalysis:
                 fig.tight_layout()
 
                 plot_filename = f"{display_name}_{self.task_type}_parity.png"
-                fig.savefig(os.path.join(plot_save_path, plot_filename), dpi=self.dpi)
+                fig.savefig(os.path.join(plot_save_path, plot_filename), dpi=self.dpi, pil_kwargs=PNG_PIL_KWARGS)
             finally:
                 plt.close(fig)
 
@@ -304,8 +303,7 @@ class RelativeEnergyAnalysis:
                 print(f"  Warning: Result file not found for {mlip_name}")
                 continue
                 
-            with open(result_path, 'r') as f:
-                results = json.load(f)
+            results = read_json(result_path)
             
             system_data = []
             ref_values = []
@@ -364,36 +362,46 @@ class RelativeEnergyAnalysis:
         output_file = f"{self.benchmark}_Relative_{self.task_info['name'].replace(' ', '_')}_Analysis.xlsx"
         
         with pd.ExcelWriter(output_file, engine="xlsxwriter") as writer:
-            self._create_summary_sheet_multi(writer, summary_data)
+            formats = self._create_excel_formats(writer.book)
+            self._create_summary_sheet_multi(writer, summary_data, formats)
             
             for mlip_name, system_data in all_mlip_data.items():
-                self._create_detailed_sheet(writer, system_data, mlip_name)
+                self._create_detailed_sheet(writer, system_data, mlip_name, formats)
                 
         print(f"Excel file '{output_file}' created successfully.")
 
-    def _create_summary_sheet_multi(self, writer, summary_data):
+    def _create_excel_formats(self, workbook):
+        """Create the cell formats used by the Excel sheets, once per workbook."""
+        return {
+            "header_format": workbook.add_format({
+                "align": "center", 
+                "valign": "vcenter",
+                "text_wrap": True,
+                "bold": True
+            }),
+            "center_align": workbook.add_format({"align": "center", "valign": "vcenter"}),
+            "bold_center_align": workbook.add_format({
+                "align": "center", 
+                "valign": "vcenter", 
+                "bold": True
+            }),
+            "number_format_3f": workbook.add_format(
+                {"num_format": "0.000", "align": "center", "valign": "vcenter"}
+            ),
+            "number_format_0f": workbook.add_format(
+                {"num_format": "#,##0", "align": "center", "valign": "vcenter"}
+            ),
+        }
+
+    def _create_summary_sheet_multi(self, writer, summary_data, formats):
         """Create MLIP_Data summary sheet for multiple MLIPs."""
-        workbook = writer.book
-        worksheet = workbook.add_worksheet("MLIP_Data")
+        worksheet = writer.book.add_worksheet("MLIP_Data")
         
-        header_format = workbook.add_format({
-            "align": "center", 
-            "valign": "vcenter",
-            "text_wrap": True,
-            "bold": True
-        })
-        center_align = workbook.add_format({"align": "center", "valign": "vcenter"})
-        bold_center_align = workbook.add_format({
-            "align": "center", 
-            "valign": "vcenter", 
-            "bold": True
-        })
-        number_format_3f = workbook.add_format(
-            {"num_format": "0.000", "align": "center", "valign": "vcenter"}
-        )
-        number_format_0f = workbook.add_format(
-            {"num_format": "#,##0", "align": "center", "valign": "vcenter"}
-        )
+        # Formats shared across sheets (see _create_excel_formats)
+        header_format = formats["header_format"]
+        bold_center_align = formats["bold_center_align"]
+        number_format_3f = formats["number_format_3f"]
+        number_format_0f = formats["number_format_0f"]
         
         headers = ["MLIP Name", f"MAE ({self.task_info['unit']})", f"RMSE ({self.task_info['unit']})",
                   f"Max Error ({self.task_info['unit']})", self._count_label()]
@@ -412,25 +420,17 @@ class RelativeEnergyAnalysis:
         for col, width in enumerate(column_widths):
             worksheet.set_column(col, col, width)
         
-        for row in range(len(summary_data) + 1):
-            worksheet.set_row(row, 25)
+        worksheet.set_default_row(25)
 
-    def _create_detailed_sheet(self, writer, system_data, mlip_name):
+    def _create_detailed_sheet(self, writer, system_data, mlip_name, formats):
         """Create detailed MLIP sheet."""
-        workbook = writer.book
         display_name = self._display_mlip_name(mlip_name)
-        worksheet = workbook.add_worksheet(display_name)
+        worksheet = writer.book.add_worksheet(display_name)
         
-        header_format = workbook.add_format({
-            "align": "center", 
-            "valign": "vcenter",
-            "text_wrap": True,
-            "bold": True
-        })
-        center_align = workbook.add_format({"align": "center", "valign": "vcenter"})
-        number_format_3f = workbook.add_format(
-            {"num_format": "0.000", "align": "center", "valign": "vcenter"}
-        )
+        # Formats shared across sheets (see _create_excel_formats)
+        header_format = formats["header_format"]
+        center_align = formats["center_align"]
+        number_format_3f = formats["number_format_3f"]
         
         headers = ["System Name", f"Reference ({self.task_info['unit']})", 
                   f"MLIP Predicted ({self.task_info['unit']})", f"Difference ({self.task_info['unit']})"]
@@ -448,8 +448,7 @@ class RelativeEnergyAnalysis:
         for col, width in enumerate(column_widths):
             worksheet.set_column(col, col, width)
         
-        for row in range(len(system_data) + 1):
-            worksheet.set_row(row, 25)
+        worksheet.set_default_row(25)
 
     def analysis(self):
         """
@@ -100,8 +100,10 @@ def min_max(dft_values):
     Returns:
         tuple: (min_val, max_val) with 10% padding on each end
     """
-    min_value = float(np.min(dft_values))
-    max_value = float(np.max(dft_values))
+    # Convert once; np.min/np.max on a list would each rebuild the array
+    values = np.asarray(dft_values, dtype=float)
+    min_value = float(values.min())
+    max_value = float(values.max())
     range_value = max_value - min_value
     min_val = min_value - 0.1 * range_value
     max_val = max_value + 0.1 * range_value
@@ -158,10 +160,7 @@ def get_ads_eng_range(data_dict):
     Returns:
         tuple: (min_energy, max_energy) from all reactions
     """
-    ads_eng_values = []
-    for key in data_dict:
-        if isinstance(key, (int, str)) and str(key).isdigit():
-            ads_eng_values.append(data_dict[key]["ads_eng"])
+    ads_eng_values = [data_dict[key]["ads_eng"] for key in get_calculator_keys(data_dict)]
     return min(ads_eng_values), max(ads_eng_values)
 
 
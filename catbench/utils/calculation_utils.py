@@ -9,7 +9,6 @@ import io
 import json
 import os
 import time
-from copy import deepcopy
 
 import numpy as np
 from ase.calculators.singlepoint import SinglePointCalculator
@@ -35,6 +34,40 @@ class NumpyEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
+# Built once at import; energy_cal / energy_cal_gas run once per structure per
+# calculator, so the name -> class table is not rebuilt per relaxation.
+OPTIMIZER_CLASSES = {
+    "LBFGS": LBFGS,
+    "BFGS": BFGS,
+    "GPMin": GPMin,
+    "FIRE": FIRE,
+    "MDMin": MDMin,
+    "BFGSLineSearch": BFGSLineSearch,
+    "LBFGSLineSearch": LBFGSLineSearch,
+}
+
+
+def get_optimizer_class(optimizer):
+    """Return the ASE optimizer class for ``optimizer``; ValueError if unknown."""
+    try:
+        return OPTIMIZER_CLASSES[optimizer]
+    except KeyError:
+        raise ValueError(
+            f"Unknown optimizer: {optimizer}. Valid: {list(OPTIMIZER_CLASSES)}"
+        ) from None
+
+
+def optimizer_kwargs(opt_class, damping):
+    """Keyword arguments ``opt_class`` accepts beyond atoms/logfile/trajectory.
+
+    Only the L-BFGS family (LBFGS and its LBFGSLineSearch subclass) takes a
+    ``damping`` factor; the other ASE optimizers would reject it.
+    """
+    if damping is not None and issubclass(opt_class, LBFGS):
+        return {"damping": damping}
+    return {}
+
+
 def energy_cal_gas(
     calculator,
     atoms_origin,
@@ -45,88 +78,72 @@ def energy_cal_gas(
     filename=None,
 ):
     """Calculate energy for gas-phase molecules."""
-    optimizer_classes = {
-        "LBFGS": LBFGS,
-        "BFGS": BFGS,
-        "GPMin": GPMin,
-        "FIRE": FIRE,
-        "MDMin": MDMin,
-        "BFGSLineSearch": BFGSLineSearch,
-        "LBFGSLineSearch": LBFGSLineSearch,
-    }
-
-    if optimizer not in optimizer_classes:
-        raise ValueError(
-            f"Unknown optimizer: {optimizer}. Valid: {list(optimizer_classes)}"
-        )
-
-    if optimizer in optimizer_classes:
-        opt_class = optimizer_classes[optimizer]
-        atoms = deepcopy(atoms_origin)
-        atoms.calc = calculator
-        atomic_numbers = atoms.get_atomic_numbers()
-        max_atomic_number = np.max(atomic_numbers)
-        max_atomic_number_indices = [
-            i for i, num in enumerate(atomic_numbers) if num == max_atomic_number
-        ]
-        fixed_atom_index = np.random.choice(max_atomic_number_indices)
-        c = FixAtoms(indices=[fixed_atom_index])
-        atoms.set_constraint(c)
-        tags = np.ones(len(atoms))
-        atoms.set_tags(tags)
-
-        if save_path is not None:
-            write(save_path, atoms)
-
-        if log_path is not None and filename is not None:
-            # Same I/O decoupling as energy_cal: collect trajectory frames and the
-            # log in memory during the run, flush to disk after the timer (keeps
-            # per-step NFS writes out of opt.run()).
-            log_buf = io.StringIO()
-            log_buf.write("######################\n")
-            log_buf.write("##  MLIP relax starts  ##\n")
-            log_buf.write("######################\n")
-            log_buf.write("\nStep 1. Relaxing\n")
-            frames = []
-
-            def _snapshot(a=atoms, fr=frames):
-                snap = a.copy()
-                snap.calc = SinglePointCalculator(
-                    snap, energy=a.get_potential_energy(), forces=a.get_forces()
-                )
-                fr.append(snap)
-
-            opt = opt_class(atoms, logfile=log_buf, trajectory=None)
-            opt.attach(_snapshot, interval=1)
-            time_init = time.time()
-            opt.run(fmax=f_crit_relax, steps=500)
-            elapsed_time = time.time() - time_init
-
-            # --- excluded from elapsed_time ---
-            write(filename, frames, format="extxyz")
-            log_buf.write("Done!\n")
-            log_buf.write(f"\nElapsed time: {elapsed_time} s\n\n")
-            log_buf.write("###############################\n")
-            log_buf.write("##  Relax terminated normally  ##\n")
-            log_buf.write("###############################\n")
-            with open(log_path, "w") as _lf:
-                _lf.write(log_buf.getvalue())
-        else:
-            # Run without saving log/trajectory
-            opt = opt_class(atoms, logfile=None, trajectory=None)
-            time_init = time.time()
-            opt.run(fmax=f_crit_relax, steps=500)
-            elapsed_time = time.time() - time_init
+    opt_class = get_optimizer_class(optimizer)
+    atoms = atoms_origin.copy()
+    atoms.calc = calculator
+    # Pin one of the heaviest atoms; numbers is the raw array, so the candidate
+    # indices come from one vectorized comparison instead of a Python scan.
+    atomic_numbers = atoms.numbers
+    max_atomic_number_indices = np.flatnonzero(atomic_numbers == atomic_numbers.max())
+    fixed_atom_index = np.random.choice(max_atomic_number_indices)
+    c = FixAtoms(indices=[fixed_atom_index])
+    atoms.set_constraint(c)
+    atoms.set_tags(1)
+
+    if save_path is not None:
+        write(save_path, atoms, format="vasp")
+
+    if log_path is not None and filename is not None:
+        # Same I/O decoupling as energy_cal: collect trajectory frames and the
+        # log in memory during the run, flush to disk after the timer (keeps
+        # per-step NFS writes out of opt.run()).
+        log_buf = io.StringIO()
+        log_buf.write("######################\n")
+        log_buf.write("##  MLIP relax starts  ##\n")
+        log_buf.write("######################\n")
+        log_buf.write("\nStep 1. Relaxing\n")
+        frames = []
+
+        def _snapshot(a=atoms, fr=frames):
+            snap = a.copy()
+            snap.calc = SinglePointCalculator(
+                snap, energy=a.get_potential_energy(), forces=a.get_forces()
+            )
+            fr.append(snap)
+
+        opt = opt_class(atoms, logfile=log_buf, trajectory=None)
+        opt.attach(_snapshot, interval=1)
+        time_init = time.time()
+        opt.run(fmax=f_crit_relax, steps=500)
+        elapsed_time = time.time() - time_init
+
+        # --- excluded from elapsed_time ---
+        write(filename, frames, format="extxyz")
+        log_buf.write("Done!\n")
+        log_buf.write(f"\nElapsed time: {elapsed_time} s\n\n")
+        log_buf.write("###############################\n")
+        log_buf.write("##  Relax terminated normally  ##\n")
+        log_buf.write("###############################\n")
+        with open(log_path, "w") as _lf:
+            _lf.write(log_buf.getvalue())
+    else:
+        # Run without saving log/trajectory
+        opt = opt_class(atoms, logfile=None, trajectory=None)
+        time_init = time.time()
+        opt.run(fmax=f_crit_relax, steps=500)
+        elapsed_time = time.time() - time_init
 
-        return atoms, atoms.get_potential_energy()
+    return atoms, atoms.get_potential_energy()
 
 
 def energy_cal_single(calculator, atoms_origin):
     """Calculate single-point energy without optimization."""
-    atoms = deepcopy(atoms_origin)
+    atoms = atoms_origin.copy()
     atoms.calc = calculator
-    tags = np.ones(len(atoms))
-    atoms.set_tags(tags)
+    # Uniform tag 1 on every structure: tag-aware MLIPs (e.g. OC20-style models)
+    # read tags, so they are set rather than skipped. A scalar lets ASE fill the
+    # integer tags array directly instead of casting a float64 np.ones per call.
+    atoms.set_tags(1)
     return atoms.get_potential_energy()
 
 
@@ -142,81 +159,64 @@ def energy_cal(
     filename=None,
 ):
     """Calculate energy with structure optimization."""
-    atoms = deepcopy(atoms_origin)
+    opt_class = get_optimizer_class(optimizer)
+    opt_kwargs = optimizer_kwargs(opt_class, damping)
+    atoms = atoms_origin.copy()
     atoms.calc = calculator
-    tags = np.ones(len(atoms))
-    atoms.set_tags(tags)
+    atoms.set_tags(1)
     if fixed_indices is not None:
         atoms.set_constraint(FixAtoms(indices=list(fixed_indices)))
     # Record initial energy before optimization
     initial_energy = atoms.get_potential_energy()
 
-    optimizer_classes = {
-        "LBFGS": LBFGS,
-        "BFGS": BFGS,
-        "GPMin": GPMin,
-        "FIRE": FIRE,
-        "MDMin": MDMin,
-        "BFGSLineSearch": BFGSLineSearch,
-        "LBFGSLineSearch": LBFGSLineSearch,
-    }
-
-    if optimizer not in optimizer_classes:
-        raise ValueError(
-            f"Unknown optimizer: {optimizer}. Valid: {list(optimizer_classes)}"
-        )
-
-    if optimizer in optimizer_classes:
-        opt_class = optimizer_classes[optimizer]
-
-        if logfile is None or filename is None:
-            # Run without saving log/trajectory
-            opt = opt_class(atoms, logfile=None, trajectory=None)
-            time_init = time.time()
-            opt.run(fmax=f_crit_relax, steps=n_crit_relax)
-            elapsed_time = time.time() - time_init
-        else:
-            # Timing integrity: keep ALL disk I/O (trajectory + log) OUTSIDE the
-            # timer. The ASE optimizer, given trajectory=filename / a file logfile,
-            # writes to disk every step inside opt.run() -- on a network filesystem
-            # those per-step writes contaminate elapsed_time (and thus
-            # time_per_step) with filesystem speed instead of model compute. Here
-            # the trajectory frames and the log are collected in memory during the
-            # run (microseconds) and flushed to disk only after the timer stops.
-            log_buf = io.StringIO()
-            log_buf.write("######################\n")
-            log_buf.write("##  MLIP relax starts  ##\n")
-            log_buf.write("######################\n")
-            log_buf.write("\nStep 1. Relaxing\n")
-            frames = []
-
-            def _snapshot(a=atoms, fr=frames):
-                # copy() drops the calculator, so re-attach the (already cached)
-                # energy/forces as a SinglePointCalculator to keep the saved
-                # trajectory faithful; these reads are cached -> microseconds.
-                snap = a.copy()
-                snap.calc = SinglePointCalculator(
-                    snap, energy=a.get_potential_energy(), forces=a.get_forces()
-                )
-                fr.append(snap)
-
-            opt = opt_class(atoms, logfile=log_buf, trajectory=None)
-            opt.attach(_snapshot, interval=1)
-            time_init = time.time()
-            opt.run(fmax=f_crit_relax, steps=n_crit_relax)
-            elapsed_time = time.time() - time_init
-
-            # --- everything below is excluded from elapsed_time ---
-            write(filename, frames, format="extxyz")
-            log_buf.write("Done!\n")
-            log_buf.write(f"\nElapsed time: {elapsed_time} s\n\n")
-            log_buf.write("###############################\n")
-            log_buf.write("##  Relax terminated normally  ##\n")
-            log_buf.write("###############################\n")
-            with open(logfile, "w") as _lf:
-                _lf.write(log_buf.getvalue())
-        final_energy = atoms.get_potential_energy()
-        energy_change = final_energy - initial_energy  # Negative = stabilization
+    if logfile is None or filename is None:
+        # Run without saving log/trajectory
+        opt = opt_class(atoms, logfile=None, trajectory=None, **opt_kwargs)
+        time_init = time.time()
+        opt.run(fmax=f_crit_relax, steps=n_crit_relax)
+        elapsed_time = time.time() - time_init
+    else:
+        # Timing integrity: keep ALL disk I/O (trajectory + log) OUTSIDE the
+        # timer. The ASE optimizer, given trajectory=filename / a file logfile,
+        # writes to disk every step inside opt.run() -- on a network filesystem
+        # those per-step writes contaminate elapsed_time (and thus
+        # time_per_step) with filesystem speed instead of model compute. Here
+        # the trajectory frames and the log are collected in memory during the
+        # run (microseconds) and flushed to disk only after the timer stops.
+        log_buf = io.StringIO()
+        log_buf.write("######################\n")
+        log_buf.write("##  MLIP relax starts  ##\n")
+        log_buf.write("######################\n")
+        log_buf.write("\nStep 1. Relaxing\n")
+        frames = []
+
+        def _snapshot(a=atoms, fr=frames):
+            # copy() drops the calculator, so re-attach the (already cached)
+            # energy/forces as a SinglePointCalculator to keep the saved
+            # trajectory faithful; these reads are cached -> microseconds.
+            snap = a.copy()
+            snap.calc = SinglePointCalculator(
+                snap, energy=a.get_potential_energy(), forces=a.get_forces()
+            )
+            fr.append(snap)
+
+        opt = opt_class(atoms, logfile=log_buf, trajectory=None, **opt_kwargs)
+        opt.attach(_snapshot, interval=1)
+        time_init = time.time()
+        opt.run(fmax=f_crit_relax, steps=n_crit_relax)
+        elapsed_time = time.time() - time_init
+
+        # --- everything below is excluded from elapsed_time ---
+        write(filename, frames, format="extxyz")
+        log_buf.write("Done!\n")
+        log_buf.write(f"\nElapsed time: {elapsed_time} s\n\n")
+        log_buf.write("###############################\n")
+        log_buf.write("##  Relax terminated normally  ##\n")
+        log_buf.write("###############################\n")
+        with open(logfile, "w") as _lf:
+            _lf.write(log_buf.getvalue())
+    final_energy = atoms.get_potential_energy()
+    energy_change = final_energy - initial_energy  # Negative = stabilization
 
     return final_energy, opt.nsteps, atoms, elapsed_time, energy_change
 
@@ -232,11 +232,10 @@ def get_fixed_indices(atoms):
     Returns:
         list[int]: Sorted, de-duplicated indices of fixed atoms (may be empty)
     """
-    indices = []
-    for c in atoms.constraints:
-        if isinstance(c, FixAtoms):
-            indices.extend(int(i) for i in c.get_indices())
-    return sorted(set(indices))
+    indices = [c.get_indices() for c in atoms.constraints if isinstance(c, FixAtoms)]
+    if not indices:
+        return []
+    return np.unique(np.concatenate(indices)).astype(int).tolist()
 
 
 def calc_displacement(atoms1, atoms2, fixed_indices=None):
@@ -255,15 +254,14 @@ def calc_displacement(atoms1, atoms2, fixed_indices=None):
             - mae_mobile: Mean Absolute Error of mobile (free) atoms displacement
             - rmsd_mobile: Root Mean Square Deviation of mobile (free) atoms displacement
     """
-    positions1 = atoms1.get_positions()
-    positions2 = atoms2.get_positions()
+    # Read the position arrays directly (no get_positions() copies); the
+    # subtraction below is the only per-atom allocation.
+    diffs = atoms2.positions - atoms1.positions
 
-    # Calculate displacement for each atom.
     # Apply the minimum-image convention so displacements are correct for
     # non-orthogonal cells and atoms that wrapped across a periodic boundary.
-    diffs = positions2 - positions1
-    mic_diffs, _ = find_mic(diffs, atoms1.cell, atoms1.pbc)
-    displacement_magnitudes = np.linalg.norm(mic_diffs, axis=1)
+    # find_mic already returns the per-atom lengths, so no second norm pass.
+    _, displacement_magnitudes = find_mic(diffs, atoms1.cell, atoms1.pbc)
 
     # Maximum displacement of any atom
     max_disp = np.max(displacement_magnitudes)
@@ -275,7 +273,7 @@ def calc_displacement(atoms1, atoms2, fixed_indices=None):
         if len(fixed_indices) > 0:
             mobile_mask[list(fixed_indices)] = False
 
-        if np.sum(mobile_mask) > 0:
+        if mobile_mask.any():
             mobile_displacements = displacement_magnitudes[mobile_mask]
             mae_mobile = np.mean(mobile_displacements)  # Mean Absolute Error
             rmsd_mobile = np.sqrt(np.mean(mobile_displacements**2))  # Root Mean Square Deviation
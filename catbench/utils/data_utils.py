@@ -13,6 +13,7 @@ import io
 import os
 from ase import Atoms
 from ase.io import write, read
+from catbench.utils.io_utils import read_json
 
 
 def detect_adsorbate_indices(slab_atoms, adslab_atoms) -> List[int]:
@@ -194,9 +195,11 @@ def _write_catbench_json(data_dict: Dict[str, Any], filepath: str, dedup: bool =
     if dedup:
         _dedup_structures_inplace(json_data)
 
-    # Save to JSON file
+    # Save to JSON file. Encode to one string and write it in a single call:
+    # json.dump would issue a write() per encoder chunk, which on a dataset of
+    # thousands of embedded structures means a great many small writes.
     with open(filepath, 'w') as f:
-        json.dump(json_data, f, indent=2)
+        f.write(json.dumps(json_data, indent=2))
 
     print(f"Data saved to {filepath}")
 
@@ -218,14 +221,12 @@ def cleanup_vasp_files(directory: str, keep_files: List[str] = None, verbose: bo
         >>> cleanup_vasp_files("my_dataset/")
         >>> cleanup_vasp_files("my_dataset/", keep_files=["CONTCAR", "OSZICAR", "OUTCAR"])
     """
-    if keep_files is None:
-        keep_files = ["CONTCAR", "OSZICAR"]
+    keep_files = {"CONTCAR", "OSZICAR"} if keep_files is None else set(keep_files)
     
     deleted_count = 0
     for dirpath, dirnames, filenames in os.walk(directory):
         # Check if this directory contains VASP output files
-        vasp_files = set(filenames)
-        if "OSZICAR" in vasp_files or "CONTCAR" in vasp_files:
+        if "OSZICAR" in filenames or "CONTCAR" in filenames:
             # Delete files that are not in keep_files list
             for file in filenames:
                 if file not in keep_files:
@@ -252,9 +253,8 @@ def load_catbench_json(filepath: str) -> Dict[str, Any]:
     Returns:
         Dictionary with ASE Atoms objects restored
     """
-    # Load JSON data
-    with open(filepath, 'r') as f:
-        json_data = json.load(f)
+    # Load JSON data (orjson-backed when installed; these files are large)
+    json_data = read_json(filepath)
 
     # Resolve deduplicated structures (1.1.1): rehydrate each "ref" pointer from
     # the top-level "_structures" map back to verbatim "atoms_json", then remove
@@ -9,6 +9,12 @@ import json
 from typing import Dict, Any, Tuple, Optional
 from catbench.utils.calculation_utils import NumpyEncoder
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 
 # =============================================================================
 # PATH GENERATION FUNCTIONS
@@ -59,7 +65,8 @@ def create_calculation_directories(save_directory: str) -> None:
 # JSON I/O WITH NUMPY SUPPORT
 # =============================================================================
 
-def save_json(data: Dict[str, Any], filepath: str, use_numpy_encoder: bool = True) -> None:
+def save_json(data: Dict[str, Any], filepath: str, use_numpy_encoder: bool = True,
+              indent: Optional[int] = 4) -> None:
     """
     Save data to JSON file with NumpyEncoder support.
     
@@ -67,18 +74,45 @@ def save_json(data: Dict[str, Any], filepath: str, use_numpy_encoder: bool = Tru
         data: Dictionary to save
         filepath: Path to save JSON file
         use_numpy_encoder: Whether to use NumpyEncoder for numpy arrays
+        indent: Indentation for human-readable output; None writes compact JSON
+                (for machine-only caches, where pretty-printing costs time and size)
     """
     # Write to a temp file then atomically replace, so a kill mid-write cannot
     # corrupt an existing result file (os.replace is atomic on POSIX).
     tmp_path = filepath + ".tmp"
     with open(tmp_path, "w") as f:
         if use_numpy_encoder:
-            json.dump(data, f, indent=4, cls=NumpyEncoder)
+            json.dump(data, f, indent=indent, cls=NumpyEncoder)
         else:
-            json.dump(data, f, indent=4)
+            json.dump(data, f, indent=indent)
     os.replace(tmp_path, filepath)
 
 
+def read_json(filepath: str) -> Any:
+    """
+    Parse a JSON file, using orjson when it is installed (pip install catbench[fast]).
+
+    orjson rejects the non-standard NaN/Infinity tokens that ``json.dump`` writes
+    for diverged energies, so files containing them go straight to the stdlib
+    parser (a substring scan decides, so they are not parsed twice); the result
+    is identical either way.
+    """
+    with open(filepath, "rb") as f:
+        return loads_json(f.read())
+
+
+def loads_json(data: Any) -> Any:
+    """Parse a JSON str/bytes document; orjson-backed like ``read_json``."""
+    if _ORJSON_AVAILABLE:
+        tokens = ("NaN", "Infinity") if isinstance(data, str) else (b"NaN", b"Infinity")
+        if not any(token in data for token in tokens):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
 def load_json(filepath: str, default: Optional[Dict] = None) -> Dict[str, Any]:
     """
     Load JSON file, returning default if file doesn't exist.
@@ -93,8 +127,7 @@ def load_json(filepath: str, default: Optional[Dict] = None) -> Dict[str, Any]:
     if not os.path.exists(filepath):
         return default if default is not None else {}
     
-    with open(filepath, "r") as f:
-        return json.load(f)
+    return read_json(filepath)
 
 
 # =============================================================================
@@ -116,6 +149,10 @@ def load_existing_results(save_directory: str, mlip_name: str) -> Tuple[Dict, Di
     _non_reaction_keys = {"calculation_settings", "_failures"}
     final_result = {k: v for k, v in result_data.items() if k not in _non_reaction_keys}
     
+    # Reactions finished after the last checkpoint live only in the journal
+    for key, value in load_result_journal(save_directory, mlip_name).items():
+        final_result.setdefault(key, value)
+    
     # Load gas energies
     gas_path = os.path.join(save_directory, f"{mlip_name}_gases.json")
     gas_energies = load_json(gas_path, {})
@@ -133,13 +170,50 @@ def load_existing_results(save_directory: str, mlip_name: str) -> Tuple[Dict, Di
     return final_result, gas_energies, gas_energies_single
 
 
+def append_result_journal(save_directory: str, mlip_name: str,
+                          key: str, reaction_result: Dict[str, Any]) -> None:
+    """
+    Append one finished reaction to {mlip_name}_result.jsonl.
+
+    The full result file is only rewritten every ``save_step`` reactions (a
+    rewrite costs O(completed reactions)); the journal makes every reaction
+    restart-safe in between at O(1) per reaction. It is folded back in by
+    ``load_existing_results`` and removed by the next full save.
+    """
+    journal_path = os.path.join(save_directory, f"{mlip_name}_result.jsonl")
+    with open(journal_path, "a") as f:
+        f.write(json.dumps({key: reaction_result}, cls=NumpyEncoder) + "\n")
+
+
+def load_result_journal(save_directory: str, mlip_name: str) -> Dict[str, Any]:
+    """Read {mlip_name}_result.jsonl, ignoring a line truncated by a kill mid-write."""
+    journal_path = os.path.join(save_directory, f"{mlip_name}_result.jsonl")
+    entries = {}
+    if not os.path.exists(journal_path):
+        return entries
+    with open(journal_path, "r") as f:
+        for line in f:
+            try:
+                entries.update(json.loads(line))
+            except ValueError:
+                continue
+    return entries
+
+
 def save_calculation_results(save_directory: str, mlip_name: str,
                             result_data: Dict[str, Any],
                             gas_energies: Optional[Dict] = None,
                             gas_energies_single: Optional[Dict] = None,
                             calculation_settings: Optional[Dict] = None,
-                            failures: Optional[Dict] = None) -> None:
-    """Save calculation results to JSON files."""
+                            failures: Optional[Dict] = None,
+                            pretty: bool = True) -> None:
+    """
+    Save calculation results to JSON files.
+
+    ``pretty=False`` writes the result file as compact JSON. It is used for
+    the intermediate save_step checkpoints, whose cost grows with every
+    completed reaction; the final save stays indented for reading.
+    """
     # Create result dictionary with calculation_settings first
     result_with_settings = {}
     if calculation_settings:
@@ -155,8 +229,20 @@ def save_calculation_results(save_directory: str, mlip_name: str,
     
     # Save main results
     result_path = os.path.join(save_directory, f"{mlip_name}_result.json")
-    save_json(result_with_settings, result_path)
+    save_json(result_with_settings, result_path, indent=4 if pretty else None)
+
+    # Everything journaled so far is now in the result file
+    journal_path = os.path.join(save_directory, f"{mlip_name}_result.jsonl")
+    if os.path.exists(journal_path):
+        os.remove(journal_path)
     
+    save_gas_energies(save_directory, mlip_name, gas_energies, gas_energies_single)
+
+
+def save_gas_energies(save_directory: str, mlip_name: str,
+                      gas_energies: Optional[Dict] = None,
+                      gas_energies_single: Optional[Dict] = None) -> None:
+    """Save the relaxed and single-point gas energy caches (atomic writes)."""
     # Save gas energies if provided
     if gas_energies is not None:
         gas_path = os.path.join(save_directory, f"{mlip_name}_gases.json")
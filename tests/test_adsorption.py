@@ -60,3 +60,63 @@ def test_oc20_mode_accepted():
         [_dummy_calc()], mode="oc20", mlip_name="x", benchmark="y"
     )
     assert calc.mode == "oc20"
+
+
+def test_rejects_unknown_optimizer():
+    with pytest.raises(ValueError):
+        AdsorptionCalculation(
+            [_dummy_calc()], mlip_name="x", benchmark="y", optimizer="NoSuchOpt"
+        )
+
+
+def test_analysis_reuses_parsed_result_until_file_changes(tmp_path):
+    import json
+    import os
+    from catbench.adsorption import AdsorptionAnalysis
+
+    result_dir = tmp_path / "EMT"
+    result_dir.mkdir()
+    result_file = result_dir / "EMT_result.json"
+    result_file.write_text(json.dumps({"rxn": {"reference": {"ads_eng": -1.0}}}))
+
+    analysis = AdsorptionAnalysis(calculating_path=str(tmp_path), plot_enabled=False)
+    first = analysis._load_mlip_result("EMT")
+    assert analysis._load_mlip_result("EMT") is first
+
+    result_file.write_text(json.dumps({"rxn": {"reference": {"ads_eng": -2.0}}}))
+    mtime = os.path.getmtime(result_file) + 10
+    os.utime(result_file, (mtime, mtime))
+    assert analysis._load_mlip_result("EMT")["rxn"]["reference"]["ads_eng"] == -2.0
+
+
+def test_multi_plot_legend_rendered_once_per_distinct_entries(tmp_path):
+    import numpy as np
+    from catbench.adsorption import AdsorptionAnalysis
+
+    classes = ["normal", "energy_anomaly", "adsorbate_migration",
+               "unphysical_relaxation", "reproduction_failure"]
+
+    def bucket(n):
+        values = np.linspace(-1.0, 1.0, n)
+        return {"DFT": values, "MLIP": values + 0.1,
+                "MLIP_min": values, "MLIP_max": values + 0.2}
+
+    # Seven long adsorbate names push the legend out into its own legend.png
+    adsorbates = [f"adsorbate{k}" for k in range(7)]
+    ads_data = {ads: {c: bucket(3 if c == "normal" else 0) for c in classes}
+                for ads in adsorbates}
+    ads_data[adsorbates[0]]["energy_anomaly"] = bucket(2)
+    ads_data["all"] = {c: bucket(0) for c in classes}
+
+    analysis = AdsorptionAnalysis(calculating_path=str(tmp_path))
+    legend = tmp_path / "legend.png"
+
+    analysis.multi_plotter(ads_data, "m", ["normal"], "normal", -2, 2, str(tmp_path))
+    assert legend.exists()
+    legend.unlink()
+    # Same entries as the legend already written -> not re-rendered
+    analysis.multi_plotter(ads_data, "m", ["normal", "anomaly"], "total", -2, 2, str(tmp_path))
+    assert not legend.exists()
+    # Fewer entries (only adsorbate0 has anomalies) -> rewritten
+    analysis.multi_plotter(ads_data, "m", ["anomaly"], "anomaly", -2, 2, str(tmp_path))
+    assert legend.exists()
@@ -101,3 +101,45 @@ def test_anomaly_detail_columns_do_not_leak_across_groups(tmp_path):
         )
     finally:
         os.chdir(cwd)
+
+
+def test_parallel_mlip_analysis_matches_serial(tmp_path, monkeypatch):
+    import shutil
+    import numpy as np
+
+    tmp = str(tmp_path)
+    monkeypatch.chdir(tmp)
+    _build_and_run(tmp)
+    src = os.path.join(tmp, "result", "EMT")
+    dst = os.path.join(tmp, "result", "EMT2")
+    shutil.copytree(src, dst)
+    for name in os.listdir(dst):
+        if name.startswith("EMT_"):
+            os.rename(os.path.join(dst, name), os.path.join(dst, "EMT2_" + name[4:]))
+
+    captured = []
+    monkeypatch.setattr(
+        AdsorptionAnalysis, "_create_excel_output",
+        lambda self, *args: captured.append((args, dict(self._adwt_cache), dict(self._amdwt_cache),
+                                             sorted(self._result_file_cache))),
+    )
+    AdsorptionAnalysis(plot_enabled=False).analysis()
+    AdsorptionAnalysis(plot_enabled=False, n_workers=2).analysis()
+
+    def normalize(x):
+        if isinstance(x, dict):
+            return {k: normalize(v) for k, v in x.items()}
+        if isinstance(x, (list, tuple)):
+            return [normalize(v) for v in x]
+        if isinstance(x, np.ndarray):
+            return normalize(x.tolist())
+        if isinstance(x, float) and np.isnan(x):
+            return "nan"
+        return x
+
+    serial, parallel = captured
+    assert len(serial[0][0]) == 2
+    # parsed result files come back from the workers, so the parent does not
+    # re-read them in the threshold-sensitivity pass
+    assert parallel[3] == ["EMT", "EMT2"]
+    assert normalize(parallel) == normalize(serial)
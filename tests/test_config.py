@@ -5,7 +5,9 @@ import pytest
 from catbench.config import (
     ANALYSIS_DEFAULTS,
     CALCULATION_DEFAULTS,
+    PLOT_COLOR_CYCLE,
     PLOT_COLORS,
+    PLOT_MARKER_CYCLE,
     PLOT_MARKERS,
     RELATIVE_ANALYSIS_DEFAULTS,
     get_default,
@@ -63,3 +65,12 @@ def test_get_default_resolves_lambda(tmp_path, monkeypatch):
 def test_plot_color_and_marker_lists_are_nonempty():
     assert len(PLOT_COLORS) > 0
     assert len(PLOT_MARKERS) > 0
+
+
+def test_plot_lists_keep_historical_shape():
+    # the public lists stay mutable and pre-repeated; the plotters cycle the
+    # unique-entry tuples instead
+    assert isinstance(PLOT_COLORS, list) and len(PLOT_COLORS) == 100 * len(PLOT_COLOR_CYCLE)
+    assert isinstance(PLOT_MARKERS, list) and len(PLOT_MARKERS) == 100 * len(PLOT_MARKER_CYCLE)
+    assert PLOT_COLORS[:len(PLOT_COLOR_CYCLE)] == list(PLOT_COLOR_CYCLE)
+    assert PLOT_MARKERS[:len(PLOT_MARKER_CYCLE)] == list(PLOT_MARKER_CYCLE)
@@ -103,6 +103,70 @@ def test_aseify_reactions_none_constraints_yields_no_fixatoms():
     assert [c for c in gas.constraints if isinstance(c, FixAtoms)] == []
 
 
+def test_aseify_reactions_parallel_matches_serial():
+    def _reactions():
+        out = []
+        for n in range(2, 9):
+            atoms = _sample_atoms(n)
+            out.append({
+                "Equation": f"r{n}",
+                "reactionSystems": [{
+                    "name": "star",
+                    "systems": {
+                        "energy": -float(n),
+                        "constraints": json.dumps(
+                            [{"name": "FixAtoms", "kwargs": {"indices": [0]}}]
+                        ),
+                        "InputFile": _ase_json(atoms),
+                    },
+                }],
+            })
+        return out
+
+    serial, parallel = _reactions(), _reactions()
+    aseify_reactions(serial)
+    aseify_reactions(parallel, n_workers=3)
+    assert [r["Equation"] for r in parallel] == [r["Equation"] for r in serial]
+    for a, b in zip(serial, parallel):
+        sa, sb = a["reactionSystems"]["star"], b["reactionSystems"]["star"]
+        assert sa["energy"] == sb["energy"]
+        assert sa["atoms"] == sb["atoms"]
+        assert get_fixed_indices(sb["atoms"]) == [0]
+
+
+def test_atoms_from_ase_json_multi_row_takes_last_row(tmp_path):
+    # "ids" may decode to a list or an ndarray; both must select the last row
+    # (as read(format="json") does) instead of hitting array truthiness
+    from ase.io import read
+
+    from catbench.adsorption.data.cathub import _atoms_from_ase_json
+
+    path = tmp_path / "rows.json"
+    write(str(path), [_sample_atoms(2), _sample_atoms(3)], format="json")
+    text = path.read_text()
+    assert '"ids": [1, 2]' in text
+    as_ndarray = text.replace('"ids": [1, 2]', '"ids": {"__ndarray__": [[2], "int64", [1, 2]]}')
+
+    expected = read(io.StringIO(text), format="json")
+    assert len(expected) == 3
+    for payload in (text, as_ndarray):
+        assert _atoms_from_ase_json(payload) == expected
+
+
+def test_download_fetches_repeated_tag_once(monkeypatch):
+    import catbench.adsorption.data.cathub as cathub
+
+    calls = []
+
+    def fake_reactions_from_dataset(tag):
+        calls.append(tag)
+        return [f"{tag}-rxn"]
+
+    monkeypatch.setattr(cathub, "reactions_from_dataset", fake_reactions_from_dataset)
+    assert cathub.download(["A", "B", "A"]) == ["A-rxn", "B-rxn", "A-rxn"]
+    assert sorted(calls) == ["A", "B"]
+
+
 # --------------------------------------------------------------------------- #
 # Geometry-based fixed-atom inference (reconstruct FixAtoms when CatHub omits it)
 # --------------------------------------------------------------------------- #
@@ -5,6 +5,7 @@ no-cache numbers exactly. No GPU / MLIP needed.
 """
 import json
 import os
+import time
 
 import numpy as np
 import pytest
@@ -57,7 +58,7 @@ def _build_dataset(path, dedup):
     _write_catbench_json(data, path, dedup=dedup)
 
 
-def _run(tmp, benchmark, dedup, structure_cache):
+def _run(tmp, benchmark, dedup, structure_cache, n_workers=1):
     os.makedirs(os.path.join(tmp, "raw_data"), exist_ok=True)
     _build_dataset(os.path.join(tmp, "raw_data", f"{benchmark}_adsorption.json"), dedup)
     cwd = os.getcwd()
@@ -66,6 +67,7 @@ def _run(tmp, benchmark, dedup, structure_cache):
         AdsorptionCalculation(
             [EMT(), EMT()], mlip_name=f"EMT_{int(dedup)}_{int(structure_cache)}",
             benchmark=benchmark, save_files=False, structure_cache=structure_cache,
+            n_workers=n_workers,
         ).run()
         rp = os.path.join(tmp, "result", f"EMT_{int(dedup)}_{int(structure_cache)}",
                           f"EMT_{int(dedup)}_{int(structure_cache)}_result.json")
@@ -101,6 +103,52 @@ def test_single_point_structure_cached_on_equals_off(tmp_path):
                    - off[k]["single_calculation"]["ads_eng"]) < 1e-9
 
 
+def test_parallel_workers_equal_serial(tmp_path):
+    # reactions dispatched to a process pool reproduce the serial run exactly,
+    # and the worker-side gas/structure caches are merged back into the parent
+    serial = _ads_engs(_run(str(tmp_path / "serial"), "par", dedup=False, structure_cache=True))
+    parallel = _ads_engs(_run(str(tmp_path / "parallel"), "par", dedup=False,
+                              structure_cache=True, n_workers=2))
+    assert set(parallel) == set(serial) and len(parallel) == 3
+    for k in serial:
+        assert abs(parallel[k] - serial[k]) < 1e-6, (k, parallel[k], serial[k])
+    gas_path = os.path.join(str(tmp_path / "parallel"), "result", "EMT_0_1", "EMT_0_1_gases.json")
+    with open(gas_path) as f:
+        assert set(json.load(f)) == {"O2gas_0th", "O2gas_1th"}
+
+
+def test_parallel_results_keep_dataset_order(tmp_path, monkeypatch):
+    # later reactions finish first; the result file must still list reactions in
+    # dataset order, exactly as a serial run does
+    original = AdsorptionCalculation._attempt_reaction
+
+    def slow_first(self, mode, index, key, *args):
+        time.sleep(0.2 * (2 - index))
+        return original(self, mode, index, key, *args)
+
+    monkeypatch.setattr(AdsorptionCalculation, "_attempt_reaction", slow_first)
+    res = _run(str(tmp_path), "order", dedup=False, structure_cache=True, n_workers=3)
+    assert [k for k in res if k != "calculation_settings"] == ["O_site0", "O_site1", "O_site2"]
+
+
+def test_parallel_gases_relaxed_in_parent_only(tmp_path, monkeypatch):
+    # every gas is relaxed before the pool forks, so no two workers can relax
+    # (and write) the same molecule with diverging energies
+    import catbench.adsorption.calculation.calculation as calculation_module
+
+    pids_path = tmp_path / "gas_pids.txt"
+    original = calculation_module.energy_cal_gas
+
+    def recording_energy_cal_gas(*args, **kwargs):
+        with open(pids_path, "a") as f:
+            f.write(f"{os.getpid()}\n")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(calculation_module, "energy_cal_gas", recording_energy_cal_gas)
+    _run(str(tmp_path), "gas", dedup=False, structure_cache=True, n_workers=3)
+    assert pids_path.read_text().split() == [str(os.getpid())] * 2  # O2gas x 2 seeds
+
+
 def test_storage_dedup_on_equals_off(tmp_path):
     tmp = str(tmp_path)
     legacy = _ads_engs(_run(tmp, "ds_c", dedup=False, structure_cache=True))
@@ -14,3 +14,27 @@ def test_init_with_empty_dataset(empty_eos_json):
     assert calc.mlip_name == "x"
     assert calc.benchmark == "demo"
     assert calc.data == {}
+
+
+def test_excel_sheet_cells_written_once(chdir_tmp):
+    """Sheets are created empty and filled only by the formatter, so every
+    cell is written exactly once and a repeated sheet name is reused."""
+    import zipfile
+
+    import numpy as np
+    import pandas as pd
+
+    from catbench.eos.analysis.analysis import EOSAnalysis
+
+    df = pd.DataFrame({"MLIP": ["a", "b"], "N Points": [7, 7], "V0 (Å³)": [11.8, np.nan]})
+    analysis = EOSAnalysis(mlip_list=["a", "b"])
+    path = chdir_tmp / "eos.xlsx"
+    with pd.ExcelWriter(path, engine="xlsxwriter") as writer:
+        fmt = writer.book.add_format()
+        worksheet = analysis._add_sheet(writer, "Cu")
+        assert analysis._add_sheet(writer, "Cu") is worksheet
+        analysis._format_worksheet_detailed(worksheet, df, fmt, fmt, fmt, fmt, fmt)
+
+    shared = zipfile.ZipFile(path).read("xl/sharedStrings.xml").decode()
+    # 3 headers + 2 MLIP names, each written once (to_excel would double count)
+    assert 'count="5" uniqueCount="5"' in shared
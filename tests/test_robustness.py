@@ -199,3 +199,100 @@ def test_accessing_analysis_attribute_makes_it_importable():
     )
     assert proc.returncode == 0, proc.stderr
     assert proc.stdout.strip() == "ok", proc.stdout
+
+
+def test_result_journal_recovered_on_resume_and_cleared_on_save(tmp_path):
+    """Reactions finished after the last save_step checkpoint are journaled one
+    line each; resume folds them back in (skipping a truncated last line) and the
+    next full save supersedes the journal."""
+    from catbench.utils.io_utils import append_result_journal
+
+    mlip = "dummy"
+    save_calculation_results(str(tmp_path), mlip, {"rxn_0": {"reference": {"ads_eng": -1.0}}})
+    append_result_journal(str(tmp_path), mlip, "rxn_1", {"reference": {"ads_eng": np.float64(-2.0)}})
+    with open(tmp_path / f"{mlip}_result.jsonl", "a") as f:
+        f.write('{"rxn_2": {"refer')  # killed mid-write
+
+    final_result, _g, _gs = load_existing_results(str(tmp_path), mlip)
+    assert set(final_result) == {"rxn_0", "rxn_1"}
+    assert final_result["rxn_1"]["reference"]["ads_eng"] == -2.0
+
+    save_calculation_results(str(tmp_path), mlip, final_result)
+    assert not (tmp_path / f"{mlip}_result.jsonl").exists()
+    final_result, _g, _gs = load_existing_results(str(tmp_path), mlip)
+    assert set(final_result) == {"rxn_0", "rxn_1"}
+
+
+def test_compact_checkpoint_round_trips(tmp_path):
+    """Intermediate checkpoints are written compact (pretty=False); they must
+    load back identically, and the default final save stays indented."""
+    mlip = "dummy"
+    results = {"rxn_0": {"reference": {"ads_eng": -1.0}, "final": {"ads_eng": np.float64(-1.2)}}}
+    save_calculation_results(str(tmp_path), mlip, results, {"H2gas": -6.7}, pretty=False)
+    assert "\n" not in (tmp_path / f"{mlip}_result.json").read_text()
+    final_result, gas, _gs = load_existing_results(str(tmp_path), mlip)
+    assert final_result["rxn_0"]["final"]["ads_eng"] == -1.2
+    assert gas == {"H2gas": -6.7}
+
+    save_calculation_results(str(tmp_path), mlip, final_result)
+    assert "\n    " in (tmp_path / f"{mlip}_result.json").read_text()
+
+
+def test_read_json_accepts_nan_written_by_stdlib(tmp_path):
+    """NaN energies are written as bare NaN tokens; the (optionally orjson-backed)
+    readers must still load them rather than raise."""
+    from catbench.utils.io_utils import loads_json, read_json
+
+    path = tmp_path / "result.json"
+    path.write_text(json.dumps({"rxn": {"ads_eng": float("nan"), "stoi": {"H": 1}}}))
+
+    data = read_json(str(path))
+    assert math.isnan(data["rxn"]["ads_eng"])
+    assert data["rxn"]["stoi"] == {"H": 1}
+    assert loads_json('{"star": 1, "Hgas": 0.5}') == {"star": 1, "Hgas": 0.5}
+
+
+def test_nonstandard_json_skips_orjson(monkeypatch):
+    """Documents with NaN/Infinity tokens go straight to the stdlib parser
+    instead of failing in orjson first; clean documents still use orjson."""
+    import catbench.utils.io_utils as io_utils
+
+    seen = []
+
+    class FakeOrjson:
+        JSONDecodeError = ValueError
+
+        @staticmethod
+        def loads(data):
+            seen.append(data)
+            return json.loads(data)
+
+    monkeypatch.setattr(io_utils, "orjson", FakeOrjson, raising=False)
+    monkeypatch.setattr(io_utils, "_ORJSON_AVAILABLE", True)
+
+    assert math.isnan(io_utils.loads_json(b'{"ads_eng": NaN}')["ads_eng"])
+    assert io_utils.loads_json('{"ads_eng": -Infinity}')["ads_eng"] == -math.inf
+    assert seen == []
+    assert io_utils.loads_json(b'{"ads_eng": -1.0}') == {"ads_eng": -1.0}
+    assert seen == [b'{"ads_eng": -1.0}']
+
+
+def test_damping_reaches_lbfgs_family_only():
+    """damping is an L-BFGS parameter; it is forwarded to LBFGS/LBFGSLineSearch
+    and dropped for optimizers that do not accept it."""
+    from ase import Atoms
+    from ase.calculators.emt import EMT
+    from ase.optimize import FIRE, LBFGS, LBFGSLineSearch
+
+    from catbench.utils.calculation_utils import energy_cal, optimizer_kwargs
+
+    assert optimizer_kwargs(LBFGS, 0.5) == {"damping": 0.5}
+    assert optimizer_kwargs(LBFGSLineSearch, 0.5) == {"damping": 0.5}
+    assert optimizer_kwargs(FIRE, 0.5) == {}
+
+    atoms = Atoms("Cu2", positions=[[0, 0, 0], [0, 0, 2.3]], cell=[10, 10, 10], pbc=True)
+    for optimizer in ("LBFGS", "FIRE"):
+        energy, steps, _atoms, _t, _de = energy_cal(
+            EMT(), atoms, 0.05, 200, 0.5, [], optimizer
+        )
+        assert np.isfinite(energy) and steps > 0
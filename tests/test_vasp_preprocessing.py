@@ -53,3 +53,38 @@ def test_rejects_gas_key_without_gas_suffix(tmp_path):
 
 def test_accepts_valid_inputs(tmp_path):
     _validate_vasp_inputs(str(tmp_path), _valid_coeff())
+
+
+def _write_calc(directory, atoms, energy):
+    from ase.io import write
+
+    directory.mkdir(parents=True)
+    write(str(directory / "CONTCAR"), atoms, format="vasp")
+    (directory / "OSZICAR").write_text(
+        f"   1 F= {energy:.5f} E0= {energy:.5f}  d E =0.0\n"
+    )
+
+
+def test_vasp_preprocessing_builds_dataset_from_one_tree_scan(tmp_path, monkeypatch):
+    """process_output hands its reaction-directory scan to userdata_preprocess;
+    gas and slab directories are never taken for reactions."""
+    from ase import Atoms
+
+    from catbench.adsorption.data.vasp import vasp_preprocessing
+    from catbench.utils.data_utils import load_catbench_json
+    from catbench.utils.io_utils import get_raw_data_path
+
+    monkeypatch.chdir(tmp_path)
+    slab = Atoms("Cu2", positions=[[0, 0, 0], [0, 0, 2.5]], cell=[5, 5, 15], pbc=True)
+    adslab = slab + Atoms("H", positions=[[0, 0, 4.0]])
+    _write_calc(tmp_path / "data" / "Cu111" / "slab", slab, -10.0)
+    _write_calc(tmp_path / "data" / "Cu111" / "H", adslab, -13.5)
+    _write_calc(tmp_path / "data" / "gas" / "H2gas", Atoms("H2", positions=[[0, 0, 0], [0, 0, 0.74]], cell=[10, 10, 10]), -6.8)
+
+    vasp_preprocessing("data", {"H": {"slab": -1, "adslab": 1, "H2gas": -0.5}})
+
+    data = load_catbench_json(get_raw_data_path("data"))
+    assert list(data) == ["Cu111_H"]
+    assert set(data["Cu111_H"]["raw"]) == {"star", "Hstar", "H2gas"}
+    assert data["Cu111_H"]["ref_ads_eng"] == pytest.approx(-13.5 + 10.0 + 3.4)
+    assert data["Cu111_H"]["adsorbate_indices"] == [2]